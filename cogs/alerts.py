@@ -0,0 +1,571 @@
+import discord
+from discord.ext import commands
+from discord import app_commands
+import asyncio
+import datetime
+import re
+from typing import Literal
+from cogs.repost import get_engine
+
+# Function/Class List:
+# class AlertButton(discord.ui.DynamicItem)
+# - __init__(name, guild_id, key, label)
+# - from_custom_id(interaction, item, match)
+# - callback(interaction)
+# class AlertView(discord.ui.View)
+# - __init__(dashboard)
+# class AlertDashboard
+# - __init__(cog, doc)
+# - get_repost_timing(channel) [Repost Engine]
+# - build_repost(channel) [Repost Engine]
+# - on_reposted(channel, message) [Repost Engine]
+# class AlertDashboards(commands.Cog)
+# - __init__(bot)
+# - cog_load()
+# - cog_unload()
+# - enqueue_alert(dashboard, interaction, ping_text)
+# - alert_worker()
+# - get_target(target_id)
+# - notify_failure(items, text)
+# - deliver_alerts(target_id, items)
+# - get_docs()
+# - migrate_legacy(docs)
+# - load_dashboards()
+# - get_dashboard(guild_id, name)
+# - save_dashboard(dashboard)
+# - delete_dashboard(dashboard)
+# - create_dashboard_embed(dashboard)
+# - remove_posted(dashboard, guild)
+# - find_dashboard(interaction, name)
+# - alert(interaction, action, name, target, title) [Slash Command]
+# - alertoption(interaction, action, name, label, key, ping_text) [Slash Command]
+# - alertdashboard(interaction, name, set, text) [Slash Command]
+# - alerttime(interaction, name, timing, number, unit) [Slash Command]
+# setup(bot)
+
+# Dashboard names end up in button custom_ids ("{name}_{guild_id}_{key}"), so no underscores
+NAME_RE = re.compile(r"^[a-z0-9]{1,20}$")
+# Option keys end up in button custom_ids ("{name}_{guild_id}_{key}"), which Discord caps at 100 characters:
+# 20 (name) + 20 (guild ID) + 2 separators leaves room for keys up to 50
+OPTION_KEY_RE = re.compile(r"^[a-z0-9_-]{1,50}$")
+ALERT_CUSTOM_ID = r"(?P<name>[a-z0-9]{1,20})_(?P<guild_id>[0-9]+)_(?P<key>.+)"
+
+# Alert delivery: clicks within the window are sent to the target as one digest DM
+ALERT_BATCH_WINDOW = 2 # seconds
+ALERT_DM_MAX = 2000 # Discord message length limit
+ALERT_MAX_RETRIES = 3
+ALERT_RETRY_BASE = 2 # seconds, backoff is 2s then 4s
+
+# The old hardcoded cogs, imported into alert_dashboards on first load: name -> (target_id, target_name, title)
+LEGACY_DASHBOARDS = {
+    "bb": (1433003746719170560, "buggy", "🔔 Bother Buggy"),
+    "pp": (696554565528715285, "petal", "🔔 Pester Petal"),
+}
+
+class AlertButton(discord.ui.DynamicItem[discord.ui.Button], template=ALERT_CUSTOM_ID):
+    def __init__(self, name, guild_id, key, label=None):
+        super().__init__(discord.ui.Button(style=discord.ButtonStyle.secondary, label=label, custom_id=f"{name}_{guild_id}_{key}"))
+        self.name = name
+        self.guild_id = guild_id
+        self.key = key
+
+    @classmethod
+    async def from_custom_id(cls, interaction, item, match):
+        # Clicks on dashboards from before a restart land here: the button is rebuilt from its custom_id
+        return cls(match['name'], int(match['guild_id']), match['key'])
+
+    async def callback(self, interaction: discord.Interaction):
+        """Acknowledges the click right away and hands the alert to the delivery queue."""
+        cog = interaction.client.get_cog("Alert Dashboards")
+        dashboard = cog.get_dashboard(self.guild_id, self.name) if cog else None
+        option = next((o for o in dashboard.doc['options'] if o['key'] == self.key), None) if dashboard else None
+        if not option:
+            return await interaction.response.send_message("❌ This button isn't set up anymore!", ephemeral=True)
+
+        # Silent acknowledgement (no "Thinking..." message); the DM is sent by alert_worker
+        await interaction.response.defer()
+        cog.enqueue_alert(dashboard, interaction, option['ping_text'])
+
+class AlertView(discord.ui.View):
+    def __init__(self, dashboard):
+        super().__init__(timeout=None) # Persistent
+        self.dashboard = dashboard
+
+        # Options: List of {"label": str, "key": str, "ping_text": str}
+        # We add items sequentially so Discord handles the wrapping naturally (5 per row)
+        doc = dashboard.doc
+        for opt in doc['options']:
+            self.add_item(AlertButton(doc['name'], doc['guild_id'], opt['key'], label=opt['label']))
+
+class AlertDashboard:
+    """One guild's dashboard for one target user. Also its owner in the shared repost engine."""
+    def __init__(self, cog, doc):
+        self.cog = cog
+        self.doc = doc
+        self.repost_key = f"alert_{doc['guild_id']}_{doc['name']}"
+
+    def get_repost_timing(self, channel):
+        """Returns (mode, delay) for the dashboard, or None if sticky mode is off."""
+        if not self.doc.get('sticky_active', False): return None
+        return self.doc.get('sticky_mode', 'after'), self.doc.get('sticky_delay', 0)
+
+    async def build_repost(self, channel):
+        """Builds the dashboard embed and buttons for the engine to send."""
+        if not self.doc['options']: return None
+        return {"embed": self.cog.create_dashboard_embed(self), "view": AlertView(self)}
+
+    def on_reposted(self, channel, message):
+        """Saves the new dashboard message ID after the engine reposts it."""
+        update = {
+            "channel_id": channel.id,
+            "message_id": message.id,
+            "last_posted_at": datetime.datetime.now().timestamp()
+        }
+        self.doc.update(update)
+        self.cog.bot.db.update_doc("alert_dashboards", "dashboard_id", self.doc['dashboard_id'], update)
+
+class AlertDashboards(commands.Cog, name="Alert Dashboards"):
+    def __init__(self, bot):
+        self.bot = bot
+        self.description = "Alert Dashboards: dashboards for users to send private alerts to someone."
+        self.dashboards = {} # {(guild_id, name): AlertDashboard} - config cache for every dashboard
+        self.alert_queue = asyncio.Queue() # Clicked alerts waiting for alert_worker
+        self.targets = {} # {target_id: discord.User} - cached DM targets
+        self.alert_worker_task = None
+        # Timing, locking and the delete/send pipeline live in the shared repost engine (one listener for all dashboards)
+        self.engine = get_engine(bot)
+
+    async def cog_load(self):
+        """Loads every dashboard. No views are restored: buttons are matched by custom_id when clicked."""
+        self.load_dashboards()
+        self.bot.add_dynamic_items(AlertButton)
+        self.alert_worker_task = asyncio.create_task(self.alert_worker())
+
+    async def cog_unload(self):
+        self.bot.remove_dynamic_items(AlertButton)
+        for dashboard in self.dashboards.values():
+            self.engine.unregister_all(dashboard)
+        if self.alert_worker_task:
+            self.alert_worker_task.cancel()
+
+    # --- ALERT DELIVERY ---
+
+    def enqueue_alert(self, dashboard, interaction, ping_text):
+        """Queues one button click for delivery."""
+        # Formatting: [Nickname] [Ping Text]
+        # Then Mention + Username + Channel Link
+        nickname = interaction.user.display_name
+        username = interaction.user.name
+        header = f"[{nickname}] {ping_text}"
+        body = f"{interaction.user.mention} ({username}) {interaction.channel.jump_url}"
+
+        self.alert_queue.put_nowait({
+            "target_id": dashboard.doc['target_id'],
+            "target_name": dashboard.doc['target_name'],
+            "text": f"**{header}**\n{body}",
+            "interaction": interaction
+        })
+
+    async def alert_worker(self):
+        """Collects alerts for ALERT_BATCH_WINDOW seconds after the first one, then sends one digest per target."""
+        loop = asyncio.get_running_loop()
+        while True:
+            first = await self.alert_queue.get()
+            batches = {first['target_id']: [first]}
+
+            deadline = loop.time() + ALERT_BATCH_WINDOW
+            while True:
+                remaining = deadline - loop.time()
+                if remaining <= 0: break
+                try:
+                    item = await asyncio.wait_for(self.alert_queue.get(), timeout=remaining)
+                except asyncio.TimeoutError:
+                    break
+                batches.setdefault(item['target_id'], []).append(item)
+
+            results = await asyncio.gather(
+                *(self.deliver_alerts(target_id, items) for target_id, items in batches.items()),
+                return_exceptions=True
+            )
+            for result in results:
+                if isinstance(result, Exception):
+                    print(f"Error delivering alerts: {result}")
+
+    async def get_target(self, target_id):
+        """Returns the DM target, cached after the first lookup."""
+        target = self.targets.get(target_id) or self.bot.get_user(target_id)
+        if not target:
+            try:
+                target = await self.bot.fetch_user(target_id)
+            except (discord.NotFound, discord.HTTPException):
+                return None
+        self.targets[target_id] = target
+        return target
+
+    async def notify_failure(self, items, text):
+        """Tells everyone whose click couldn't be delivered (ephemeral follow-up)."""
+        for item in items:
+            try:
+                await item['interaction'].followup.send(text, ephemeral=True)
+            except: pass
+
+    async def deliver_alerts(self, target_id, items):
+        """Sends a batch of alerts to one target as few DMs as possible, retrying on rate limits."""
+        target_name = items[0]['target_name']
+        target = await self.get_target(target_id)
+        if not target:
+            return await self.notify_failure(items, f"❌ I couldn't find {target_name} to alert! Is the ID correct?")
+
+        # Pack alerts into digests that fit in one message each: [text, [items in it]]
+        digests = []
+        for item in items:
+            if digests and len(digests[-1][0]) + len(item['text']) + 2 <= ALERT_DM_MAX:
+                digests[-1][0] += "\n\n" + item['text']
+                digests[-1][1].append(item)
+            else:
+                digests.append([item['text'][:ALERT_DM_MAX], [item]])
+
+        for index, (digest, _) in enumerate(digests):
+            # On failure only the clicks that haven't gone out yet are told about it
+            undelivered = [item for _, digest_items in digests[index:] for item in digest_items]
+            for attempt in range(ALERT_MAX_RETRIES):
+                try:
+                    await target.send(digest)
+                    break
+                except discord.Forbidden:
+                    return await self.notify_failure(undelivered, f"❌ I couldn't DM {target_name}! Make sure their DMs are open.")
+                except discord.HTTPException as e:
+                    # discord.py already waits out 429s itself; a 429/5xx that still gets here
+                    # is retried with plain exponential backoff
+                    if (e.status == 429 or e.status >= 500) and attempt < ALERT_MAX_RETRIES - 1:
+                        await asyncio.sleep(ALERT_RETRY_BASE ** (attempt + 1))
+                        continue
+                    return await self.notify_failure(undelivered, "❌ Failed to send alert.")
+
+    # --- DB HELPERS ---
+
+    def get_docs(self):
+        return self.bot.db.get_collection("alert_dashboards") or []
+
+    def migrate_legacy(self, docs):
+        """Imports the old Bother Buggy / Pester Petal configs once.
+
+        The old collections are left untouched; "alert_migrations" records which ones were imported,
+        so a migrated dashboard that gets deleted later doesn't come back on the next restart.
+        """
+        done = self.bot.db.get_collection("alert_migrations") or []
+        pending = [name for name in LEGACY_DASHBOARDS if name not in done]
+        if not pending: return docs
+
+        existing = {(d['guild_id'], d['name']) for d in docs}
+        migrated = 0
+
+        for name in pending:
+            target_id, target_name, title = LEGACY_DASHBOARDS[name]
+            configs = {c['guild_id']: c for c in (self.bot.db.get_collection(f"{name}_options") or [])}
+            posted = {d['guild_id']: d for d in (self.bot.db.get_collection(f"{name}_dashboards") or [])}
+
+            for guild_id in set(configs) | set(posted):
+                if (guild_id, name) in existing: continue
+                config = configs.get(guild_id, {})
+                dash = posted.get(guild_id, {})
+                docs.append({
+                    "dashboard_id": f"{guild_id}_{name}",
+                    "guild_id": guild_id,
+                    "name": name,
+                    "target_id": target_id,
+                    "target_name": target_name,
+                    "title": config.get('title', title),
+                    "options": config.get('options', []),
+                    "sticky_active": config.get('sticky_active', False),
+                    "sticky_mode": config.get('sticky_mode', 'after'),
+                    "sticky_delay": config.get('sticky_delay', 0),
+                    "channel_id": dash.get('channel_id'),
+                    "message_id": dash.get('message_id'),
+                    "last_posted_at": dash.get('last_posted_at', 0)
+                })
+                migrated += 1
+
+        if migrated:
+            self.bot.db.save_collection("alert_dashboards", docs)
+            print(f"✅ Migrated {migrated} legacy alert dashboards.")
+        # Marked only after the dashboards are saved, so a failed save retries on the next load
+        self.bot.db.save_collection("alert_migrations", list(done) + pending)
+        return docs
+
+    def load_dashboards(self):
+        """Builds the dashboard cache once and registers every posted dashboard with the repost engine."""
+        self.dashboards = {}
+        for doc in self.migrate_legacy(self.get_docs()):
+            dashboard = AlertDashboard(self, doc)
+            self.dashboards[(doc['guild_id'], doc['name'])] = dashboard
+            if doc.get('channel_id'):
+                self.engine.register(dashboard, doc['channel_id'], doc.get('message_id'), doc.get('last_posted_at', 0))
+
+    def get_dashboard(self, guild_id, name):
+        return self.dashboards.get((guild_id, name))
+
+    def save_dashboard(self, dashboard):
+        """Saves one dashboard (keyed by dashboard_id) and keeps the cache in sync."""
+        doc = dashboard.doc
+        self.dashboards[(doc['guild_id'], doc['name'])] = dashboard
+        updated = self.bot.db.update_doc("alert_dashboards", "dashboard_id", doc['dashboard_id'], doc)
+        if not updated:
+            docs = self.get_docs()
+            docs.append(doc)
+            self.bot.db.save_collection("alert_dashboards", docs)
+
+    def delete_dashboard(self, dashboard):
+        doc = dashboard.doc
+        self.dashboards.pop((doc['guild_id'], doc['name']), None)
+        self.engine.unregister_all(dashboard)
+        self.bot.db.delete_doc("alert_dashboards", "dashboard_id", doc['dashboard_id'])
+
+    def create_dashboard_embed(self, dashboard):
+        embed = discord.Embed(
+            title=dashboard.doc['title'],
+            description=f"Click what you want to do with {dashboard.doc['target_name']}!",
+            color=discord.Color(0xff90aa)
+        )
+        return embed
+
+    async def remove_posted(self, dashboard, guild):
+        """Stops the dashboard sticking and deletes its current message."""
+        doc = dashboard.doc
+        if not doc.get('channel_id'): return
+
+        # The dashboard may have been reposted since the doc was read
+        slot = self.engine.get_slot(dashboard, doc['channel_id'])
+        old_id = slot.message_id if slot and slot.message_id else doc.get('message_id')
+        self.engine.unregister(dashboard, doc['channel_id'])
+
+        if old_id:
+            try:
+                chan = guild.get_channel(doc['channel_id'])
+                if chan:
+                    await chan.get_partial_message(old_id).delete()
+            except: pass
+
+        doc['channel_id'] = None
+        doc['message_id'] = None
+
+    async def find_dashboard(self, interaction, name):
+        """Looks up a dashboard by name, replying with an error if it doesn't exist."""
+        dashboard = self.get_dashboard(interaction.guild_id, (name or "").lower())
+        if not dashboard:
+            names = ", ".join(f"`{n}`" for (g, n) in self.dashboards if g == interaction.guild_id) or "none yet"
+            await interaction.response.send_message(f"❌ I couldn't find a dashboard called `{name}`. Dashboards: {names}", ephemeral=True)
+        return dashboard
+
+    # --- SLASH COMMANDS ---
+
+    @app_commands.command(name="alert", description="Create, delete or list alert dashboards.")
+    @app_commands.describe(
+        action="What would you like to do?",
+        name="[Create/Delete] Short one-word name for the dashboard (e.g. bb)",
+        target="[Create] Who receives the alerts",
+        title="[Create] Dashboard title"
+    )
+    @app_commands.default_permissions(administrator=True)
+    async def alert(self, interaction: discord.Interaction,
+                    action: Literal["Create", "Delete", "List"],
+                    name: str = None,
+                    target: discord.User = None,
+                    title: str = None):
+
+        if action == "List":
+            guild_dashboards = [d for (g, n), d in self.dashboards.items() if g == interaction.guild_id]
+            if not guild_dashboards:
+                return await interaction.response.send_message("📝 No alert dashboards yet! Create one with `/alert action:Create`.", ephemeral=True)
+
+            content = "**🔔 Alert Dashboards:**\n"
+            for d in guild_dashboards:
+                doc = d.doc
+                status = "Active" if doc.get('sticky_active') else "Inactive"
+                where = f" in <#{doc['channel_id']}>" if doc.get('channel_id') else ""
+                content += f"• `{doc['name']}` → <@{doc['target_id']}>: {len(doc['options'])} options, sticky {status}{where}\n"
+            return await interaction.response.send_message(content, ephemeral=True)
+
+        if not name:
+            return await interaction.response.send_message(f"❌ For '{action}', you must provide the dashboard `name`.", ephemeral=True)
+        name = name.lower()
+
+        if action == "Create":
+            if not target:
+                return await interaction.response.send_message("❌ For 'Create', you must provide the `target` user.", ephemeral=True)
+            if not NAME_RE.match(name):
+                return await interaction.response.send_message("❌ Names must be 1-20 lowercase letters or numbers (no spaces or underscores).", ephemeral=True)
+            if self.get_dashboard(interaction.guild_id, name):
+                return await interaction.response.send_message(f"❌ A dashboard called `{name}` already exists!", ephemeral=True)
+
+            doc = {
+                "dashboard_id": f"{interaction.guild_id}_{name}",
+                "guild_id": interaction.guild_id,
+                "name": name,
+                "target_id": target.id,
+                "target_name": target.display_name,
+                "title": title or f"🔔 {target.display_name}",
+                "options": [],
+                "sticky_active": False,
+                "sticky_mode": "after",
+                "sticky_delay": 0,
+                "channel_id": None,
+                "message_id": None,
+                "last_posted_at": 0
+            }
+            self.save_dashboard(AlertDashboard(self, doc))
+            await interaction.response.send_message(f"✅ Created `{name}` for {target.mention}! Add buttons with `/alertoption`, then spawn it with `/alertdashboard`.", ephemeral=True)
+
+        elif action == "Delete":
+            dashboard = await self.find_dashboard(interaction, name)
+            if not dashboard: return
+
+            await self.remove_posted(dashboard, interaction.guild)
+            self.delete_dashboard(dashboard)
+            await interaction.response.send_message(f"✅ Deleted the `{name}` dashboard.", ephemeral=True)
+
+    @app_commands.command(name="alertoption", description="Manage the buttons on an alert dashboard.")
+    @app_commands.describe(
+        action="What would you like to do?",
+        name="Which dashboard",
+        label="[Add] Text shown on the button",
+        key="[Add/Remove] Unique one-word ID for the option (up to 50 letters, numbers, - or _)",
+        ping_text="[Add] Message sent to the target"
+    )
+    @app_commands.default_permissions(administrator=True)
+    async def alertoption(self, interaction: discord.Interaction,
+                          action: Literal["Add", "Remove", "List"],
+                          name: str,
+                          label: str = None,
+                          key: str = None,
+                          ping_text: str = None):
+
+        dashboard = await self.find_dashboard(interaction, name)
+        if not dashboard: return
+        doc = dashboard.doc
+        options = doc['options']
+
+        if action == "Add":
+            if not label or not key or not ping_text:
+                return await interaction.response.send_message("❌ For 'Add', you must provide `label`, `key`, and `ping_text`.", ephemeral=True)
+
+            if not OPTION_KEY_RE.match(key.lower()):
+                return await interaction.response.send_message("❌ Keys must be 1-50 letters, numbers, `-` or `_` (no spaces).", ephemeral=True)
+
+            if any(o['key'] == key.lower() for o in options):
+                return await interaction.response.send_message(f"❌ An option with the key `{key}` already exists!", ephemeral=True)
+
+            if len(options) >= 25:
+                return await interaction.response.send_message("❌ Discord only allows 25 buttons per message, you popular thing!", ephemeral=True)
+
+            options.append({
+                "label": label,
+                "key": key.lower(),
+                "ping_text": ping_text
+            })
+            doc['options'] = options
+            self.save_dashboard(dashboard)
+            await interaction.response.send_message(f"✅ Added **{label}**! Use `/alertdashboard` to see the changes.", ephemeral=True)
+
+        elif action == "Remove":
+            if not key:
+                return await interaction.response.send_message("❌ For 'Remove', you must provide the `key`.", ephemeral=True)
+
+            initial_len = len(options)
+            options = [o for o in options if o['key'] != key.lower()]
+
+            if len(options) < initial_len:
+                doc['options'] = options
+                self.save_dashboard(dashboard)
+                await interaction.response.send_message(f"✅ Removed the `{key}` option for you!", ephemeral=True)
+            else:
+                await interaction.response.send_message(f"❌ I couldn't find an option with the key `{key}`.", ephemeral=True)
+
+        elif action == "List":
+            if not options:
+                return await interaction.response.send_message("📝 You haven't added any options yet!", ephemeral=True)
+
+            status = "Active" if doc.get('sticky_active') else "Inactive"
+            content = f"**Title:** {doc['title']}\n**Target:** <@{doc['target_id']}>\n**Sticky:** {status}\n**📋 Options:**\n"
+            for o in options:
+                content += f"• `{o['key']}`: **{o['label']}** (Ping: {o['ping_text']})\n"
+            await interaction.response.send_message(content, ephemeral=True)
+
+    @app_commands.command(name="alertdashboard", description="Spawn or remove an alert dashboard.")
+    @app_commands.rename(should_set="set")
+    @app_commands.describe(
+        name="Which dashboard",
+        should_set="True to spawn & stick here, False to remove & disable.",
+        text="[Optional] Set a new title."
+    )
+    @app_commands.default_permissions(administrator=True)
+    async def alertdashboard(self, interaction: discord.Interaction, name: str, should_set: bool, text: str = None):
+        dashboard = await self.find_dashboard(interaction, name)
+        if not dashboard: return
+        doc = dashboard.doc
+
+        # --- DISABLE / REMOVE ---
+        if not should_set:
+            doc['sticky_active'] = False
+            await self.remove_posted(dashboard, interaction.guild)
+            self.save_dashboard(dashboard)
+            await interaction.response.send_message("✅ Dashboard removed and sticky mode disabled.", ephemeral=True)
+            return
+
+        # --- ENABLE / SPAWN ---
+        doc['sticky_active'] = True
+        if text:
+            doc['title'] = text
+
+        if not doc['options']:
+            self.save_dashboard(dashboard)
+            return await interaction.response.send_message("❌ You need to add some options first via `/alertoption action:Add`!", ephemeral=True)
+
+        await self.remove_posted(dashboard, interaction.guild)
+
+        try:
+            msg = await interaction.channel.send(embed=self.create_dashboard_embed(dashboard), view=AlertView(dashboard))
+        except discord.HTTPException as e:
+            # e.g. an option imported with a key too long for a button custom_id
+            doc['sticky_active'] = False
+            self.save_dashboard(dashboard)
+            return await interaction.response.send_message(f"❌ Couldn't post the dashboard: {e}", ephemeral=True)
+
+        doc['channel_id'] = interaction.channel_id
+        doc['message_id'] = msg.id
+        doc['last_posted_at'] = datetime.datetime.now().timestamp()
+        self.save_dashboard(dashboard)
+        self.engine.register(dashboard, interaction.channel_id, msg.id, doc['last_posted_at'])
+
+        await interaction.response.send_message("✅ Dashboard spawned! It is now **Sticky** in this channel.", ephemeral=True)
+
+    @app_commands.command(name="alerttime", description="Configure alert dashboard sticky timing.")
+    @app_commands.describe(name="Which dashboard", timing="Mode: 'before' (Cooldown), 'throttle' (Cooldown, reposts once it ends) or 'after' (Delay)", number="Time amount", unit="Time unit")
+    @app_commands.choices(
+        timing=[
+            app_commands.Choice(name="Before (Cooldown)", value="before"),
+            app_commands.Choice(name="Throttle (Cooldown, then catch up)", value="throttle"),
+            app_commands.Choice(name="After (Delay)", value="after")
+        ],
+        unit=[app_commands.Choice(name="Seconds", value="seconds"), app_commands.Choice(name="Minutes", value="minutes")]
+    )
+    @app_commands.default_permissions(administrator=True)
+    async def alerttime(self, interaction: discord.Interaction, name: str, timing: app_commands.Choice[str], number: int, unit: app_commands.Choice[str]):
+        """Configure dashboard sticky timing."""
+        dashboard = await self.find_dashboard(interaction, name)
+        if not dashboard: return
+
+        multiplier = 60 if unit.value == 'minutes' else 1
+        total_seconds = number * multiplier
+
+        dashboard.doc['sticky_mode'] = timing.value
+        dashboard.doc['sticky_delay'] = total_seconds
+        self.save_dashboard(dashboard)
+
+        delay_text = "Instant (0s)" if total_seconds == 0 else f"{total_seconds} seconds"
+        mode_text = {"before": "Cooldown (Before)", "throttle": "Throttle (Cooldown, then catch up)"}.get(timing.value, "Delay (After)")
+
+        await interaction.response.send_message(f"✅ Dashboard sticky settings updated.\nMode: **{mode_text}**\nTime: **{delay_text}**", ephemeral=True)
+
+async def setup(bot):
+    await bot.add_cog(AlertDashboards(bot))
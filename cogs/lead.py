@@ -14,29 +14,62 @@ from typing import Literal, Optional, Union
 # - cog_unload()
 # - get_config(guild_id)
 # - save_config(guild_id, config)
+# - compile_config(config)
+# - get_compiled_config(guild_id)
+# - invalidate_config(guild_id)
 # - update_user_points(guild_id, group_key, user_id, points)
 # - get_group_points(guild_id, group_key)
 # - get_user_points(guild_id, user_id)
 # - clear_points_by_group(guild_id, group_key)
-# - get_tracked_groups(channel, config)
-# - add_points_to_cache(user_id, guild_id, group_key, points)
-# - create_leaderboard_embed(guild, group_key, group_data)
+# - get_buckets()
+# - add_to_buckets(deltas, now)
+# - clear_buckets(guild_id, group_key)
+# - compact_buckets(buckets, now)
+# - get_window_points(guild_id, group_key, window)
+# - get_tracked_groups(channel, compiled)
+# - allow_scoring(guild_id, user_id, p_vals)
+# - expire_rate_buckets()
+# - add_points_to_cache(user_id, guild_id, group_key, points, journal)
+# - append_journal(entry)
+# - flush_journal()
+# - rotate_journal()
+# - compact_journal()
+# - replay_journal()
+# - create_leaderboard_embed(guild, group_key, group_data, window)
 # - on_message(message)
 # - on_reaction_add(reaction, user)
 # - on_voice_state_update(member, before, after)
 # - voice_time_checker()
+# - journal_flusher()
 # - point_saver()
+# - refresh_leaderboards()
+# - edit_leaderboard(channel, message_id, embed)
+# - bucket_compactor()
 # - lead(interaction, action, group_num, name, reset) [Slash - Admin]
 # - track(interaction, group_num, action, channel) [Slash - Admin]
 # - setpoints(interaction, action_type, value) [Slash - Admin]
 # - award(interaction, member, group_num, amount) [Slash - Admin]
 # - remove(interaction, member, group_num, amount) [Slash - Admin]
-# - leaderboard(interaction, group_num) [Slash - Buggy/Admin]
+# - leaderboard(interaction, group_num, window) [Slash - Buggy/Admin]
 # - points(interaction, user) [Slash - Public]
 # setup(bot)
 
 BUGGY_ID = 1433003746719170560
 
+# Append-only log of point deltas not yet written to the DB (survives crashes/redeploys)
+JOURNAL_FILE = "lead_points.journal"
+JOURNAL_SAVING_FILE = "lead_points.journal.saving" # Deltas currently being flushed by point_saver
+JOURNAL_BATCH_SIZE = 25 # fsync once this many deltas are buffered
+
+LEADERBOARD_EDIT_CONCURRENCY = 5 # Max leaderboard message edits in flight across all guilds
+
+# Windowed leaderboards: points are bucketed per hour, hours older than a day roll up into days
+BUCKET_HOUR = 3600
+BUCKET_DAY = 86400
+DAILY_RETENTION = 31 * BUCKET_DAY # Longest window (month) plus the partial current day
+WINDOW_DAYS = {"day": 1, "week": 7, "month": 30}
+WINDOW_LABELS = {"day": "24 Hours", "week": "7 Days", "month": "30 Days"}
+
 class Lead(commands.Cog):
     def __init__(self, bot):
         self.bot = bot
@@ -47,21 +80,39 @@ class Lead(commands.Cog):
             'attachment': 2,
             'voice_minute': 1,
             'reaction_add': 1,
-            'reaction_receive': 2
+            'reaction_receive': 2,
+            # Anti-spam: each user can earn points from at most this many messages/reactions per window.
+            # Off (0) unless a server opts in with /setpoints rate_limit_events
+            'rate_limit_events': 0,
+            'rate_limit_window': 60
         }
 
         # Caches
         self.voice_tracker = {} 
         self.point_cache = {}          
         self.leaderboard_cache = {}    
+        self.compiled_configs = {}     # {guild_id: {"channels": {tracked_id: [group_keys]}, "point_values": {...}}}
+        self.journal_buffer = []       # Journal lines waiting for the next fsync
+        self.leaderboard_hashes = {}   # {(guild_id, group_key): hash of the last rendered embed}
+        self.rate_buckets = {}         # {(guild_id, user_id): [tokens, last_refill, window]} - scoring token buckets
+        self.suppressed_events = {}    # {guild_id: count} - scoring events dropped by the rate limit since startup
+        self.leaderboard_edit_limiter = asyncio.Semaphore(LEADERBOARD_EDIT_CONCURRENCY)
+
+        # Recover points that were cached but never saved before the last shutdown
+        self.replay_journal()
 
         # Start tasks
         self.voice_time_checker.start()
+        self.journal_flusher.start()
         self.point_saver.start()
+        self.bucket_compactor.start()
 
     def cog_unload(self):
         self.voice_time_checker.cancel()
+        self.journal_flusher.cancel()
         self.point_saver.cancel()
+        self.bucket_compactor.cancel()
+        self.flush_journal()
 
     # --- DB HELPERS (Centralized) ---
 
@@ -71,13 +122,13 @@ class Lead(commands.Cog):
         if isinstance(configs, list): configs = {}
 
         if guild_id not in configs:
-             configs[guild_id] = {
+            # Default is only persisted once an admin command saves it
+            return {
                 "groups": {
                     "1": {"name": "General", "tracked_ids": [], "last_lb_msg": None}
                 },
                 "point_values": self.DEFAULT_POINT_VALUES.copy()
-             }
-             self.bot.db.save_collection("leaderboard_configs", configs)
+            }
         
         return configs[guild_id]
 
@@ -88,6 +139,35 @@ class Lead(commands.Cog):
         
         configs[guild_id] = config
         self.bot.db.save_collection("leaderboard_configs", configs)
+        self.invalidate_config(guild_id)
+
+    # --- CONFIG CACHE ---
+
+    def compile_config(self, config):
+        """Flattens a guild config into a tracked_id -> group_keys map plus point values."""
+        channels = {}
+        for group_key, group_data in config.get("groups", {}).items():
+            for tid in group_data.get("tracked_ids", []):
+                keys = channels.setdefault(int(tid), [])
+                if group_key not in keys:
+                    keys.append(group_key)
+
+        point_values = self.DEFAULT_POINT_VALUES.copy()
+        point_values.update(config.get("point_values", {}))
+        return {"channels": channels, "point_values": point_values}
+
+    async def get_compiled_config(self, guild_id):
+        """Returns the cached compiled config, building it from the DB on a miss."""
+        guild_id = str(guild_id)
+        compiled = self.compiled_configs.get(guild_id)
+        if compiled is None:
+            compiled = self.compile_config(await self.get_config(guild_id))
+            self.compiled_configs[guild_id] = compiled
+        return compiled
+
+    def invalidate_config(self, guild_id):
+        """Drops the compiled config so the next event rebuilds it (called on every save)."""
+        self.compiled_configs.pop(str(guild_id), None)
 
     async def update_user_points(self, guild_id, group_key, user_id, points):
         guild_id = str(guild_id)
@@ -147,24 +227,141 @@ class Lead(commands.Cog):
         self.bot.db.save_collection("leaderboard_points", new_collection)
         return initial_count - len(new_collection)
 
+    # --- WINDOW BUCKETS ---
+    # Layout: {guild_id: {group_key: {"hours": {hour_ts: {user_id: points}}, "days": {day_ts: {user_id: points}}}}}
+    # Each group holds at most ~25 hour buckets and 31 day buckets, so memory stays bounded per user.
+
+    def get_buckets(self):
+        buckets = self.bot.db.get_collection("leaderboard_buckets")
+        if isinstance(buckets, list): buckets = {}
+        return buckets
+
+    async def add_to_buckets(self, deltas, now=None):
+        """Adds {guild_id: {group_key: {user_id: points}}} to the current hour bucket."""
+        now = now or time.time()
+        hour_ts = str(int(now // BUCKET_HOUR * BUCKET_HOUR))
+        buckets = self.get_buckets()
+
+        for guild_id, groups in deltas.items():
+            for group_key, users in groups.items():
+                group_buckets = buckets.setdefault(str(guild_id), {}).setdefault(group_key, {"hours": {}, "days": {}})
+                hour_bucket = group_buckets["hours"].setdefault(hour_ts, {})
+                for user_id, points in users.items():
+                    user_id = str(user_id)
+                    hour_bucket[user_id] = hour_bucket.get(user_id, 0) + int(points)
+
+        self.bot.db.save_collection("leaderboard_buckets", buckets)
+
+    async def clear_buckets(self, guild_id, group_key):
+        buckets = self.get_buckets()
+        if buckets.get(str(guild_id), {}).pop(group_key, None) is not None:
+            self.bot.db.save_collection("leaderboard_buckets", buckets)
+
+    def compact_buckets(self, buckets, now):
+        """Rolls hour buckets older than a day into day buckets and drops expired days. Returns True if anything changed."""
+        hour_cutoff = now - BUCKET_DAY
+        day_cutoff = now - DAILY_RETENTION
+        changed = False
+
+        for guild_id in list(buckets.keys()):
+            groups = buckets[guild_id]
+            for group_key in list(groups.keys()):
+                hours = groups[group_key].setdefault("hours", {})
+                days = groups[group_key].setdefault("days", {})
+
+                for hour_ts in list(hours.keys()):
+                    if int(hour_ts) + BUCKET_HOUR <= hour_cutoff:
+                        day_bucket = days.setdefault(str(int(hour_ts) // BUCKET_DAY * BUCKET_DAY), {})
+                        for user_id, points in hours.pop(hour_ts).items():
+                            day_bucket[user_id] = day_bucket.get(user_id, 0) + points
+                        changed = True
+
+                for day_ts in list(days.keys()):
+                    if int(day_ts) + BUCKET_DAY <= day_cutoff:
+                        del days[day_ts]
+                        changed = True
+
+                if not hours and not days:
+                    del groups[group_key]
+                    changed = True
+
+            if not groups:
+                del buckets[guild_id]
+                changed = True
+
+        return changed
+
+    async def get_window_points(self, guild_id, group_key, window):
+        """Sums pre-aggregated buckets for a window ("day", "week" or "month") into {user_id: points}."""
+        group_buckets = self.get_buckets().get(str(guild_id), {}).get(group_key)
+        if not group_buckets:
+            return {}
+
+        now = time.time()
+        hours = group_buckets.get("hours", {})
+        if window == "day":
+            sources = [b for ts, b in hours.items() if int(ts) + BUCKET_HOUR > now - BUCKET_DAY]
+        else:
+            # Day granularity: whole days back from today, plus hours not yet rolled up
+            cutoff = (now // BUCKET_DAY - (WINDOW_DAYS[window] - 1)) * BUCKET_DAY
+            sources = [b for ts, b in group_buckets.get("days", {}).items() if int(ts) >= cutoff]
+            sources.extend(hours.values())
+
+        totals = {}
+        for bucket in sources:
+            for user_id, points in bucket.items():
+                totals[user_id] = totals.get(user_id, 0) + points
+        return totals
+
     # --- HELPERS ---
 
-    def get_tracked_groups(self, channel, config):
-        tracked_groups = []
-        if not config or "groups" not in config:
+    def get_tracked_groups(self, channel, compiled):
+        if not compiled:
             return []
 
-        for group_key, group_data in config["groups"].items():
-            tracked_ids = group_data.get("tracked_ids", [])
-            if channel.id in tracked_ids:
-                tracked_groups.append(group_key)
-                continue
-            if hasattr(channel, "category") and channel.category and channel.category.id in tracked_ids:
-                tracked_groups.append(group_key)
+        channels = compiled["channels"]
+        tracked_groups = channels.get(channel.id, [])
+
+        category_id = getattr(channel, "category_id", None)
+        if category_id:
+            category_groups = channels.get(category_id)
+            if category_groups:
+                tracked_groups = tracked_groups + [k for k in category_groups if k not in tracked_groups]
         
         return tracked_groups
 
-    def add_points_to_cache(self, user_id, guild_id, group_key, points):
+    def allow_scoring(self, guild_id, user_id, p_vals):
+        """Token bucket check: returns False (and counts it) if the user is over their scoring rate."""
+        capacity = p_vals.get('rate_limit_events', 0)
+        if capacity <= 0:
+            return True
+        window = max(p_vals.get('rate_limit_window', 60), 1)
+
+        now = time.monotonic()
+        key = (guild_id, user_id)
+        bucket = self.rate_buckets.get(key)
+        if bucket is None:
+            tokens = capacity
+        else:
+            # Refill continuously at capacity/window tokens per second
+            tokens = min(capacity, bucket[0] + (now - bucket[1]) * capacity / window)
+
+        if tokens < 1:
+            self.rate_buckets[key] = [tokens, now, window]
+            self.suppressed_events[guild_id] = self.suppressed_events.get(guild_id, 0) + 1
+            return False
+
+        self.rate_buckets[key] = [tokens - 1, now, window]
+        return True
+
+    def expire_rate_buckets(self):
+        """Drops buckets idle for a full window; they'd be refilled to capacity anyway."""
+        now = time.monotonic()
+        for key, (_, last_refill, window) in list(self.rate_buckets.items()):
+            if now - last_refill >= window:
+                del self.rate_buckets[key]
+
+    def add_points_to_cache(self, user_id, guild_id, group_key, points, journal=True):
         user_id = str(user_id)
         guild_id = str(guild_id)
         
@@ -176,13 +373,100 @@ class Lead(commands.Cog):
         current = self.point_cache[guild_id][group_key].get(user_id, 0)
         self.point_cache[guild_id][group_key][user_id] = current + int(points) 
 
-    async def create_leaderboard_embed(self, guild, group_key, group_data):
+        if journal:
+            self.append_journal({"guild_id": guild_id, "group_key": group_key, "user_id": user_id, "points": int(points)})
+
+    # --- POINT JOURNAL ---
+
+    def append_journal(self, entry):
+        """Buffers a journal entry, fsyncing once a small batch has built up."""
+        self.journal_buffer.append(json.dumps(entry) + "\n")
+        if len(self.journal_buffer) >= JOURNAL_BATCH_SIZE:
+            self.flush_journal()
+
+    def flush_journal(self):
+        """Appends buffered entries to the journal file and fsyncs it."""
+        if not self.journal_buffer:
+            return
+        lines, self.journal_buffer = self.journal_buffer, []
+        try:
+            with open(JOURNAL_FILE, "a") as f:
+                f.write("".join(lines))
+                f.flush()
+                os.fsync(f.fileno())
+        except OSError as e:
+            print(f"Failed to write point journal: {e}")
+            self.journal_buffer = lines + self.journal_buffer
+
+    def rotate_journal(self):
+        """Moves the live journal aside so new deltas don't get truncated with the ones being saved."""
+        self.flush_journal()
+        if not os.path.exists(JOURNAL_FILE):
+            return
+        if os.path.exists(JOURNAL_SAVING_FILE):
+            # A previous flush failed half way; keep both sets of deltas together
+            with open(JOURNAL_FILE, "r") as src, open(JOURNAL_SAVING_FILE, "a") as dst:
+                dst.write(src.read())
+                dst.flush()
+                os.fsync(dst.fileno())
+            os.remove(JOURNAL_FILE)
+        else:
+            os.replace(JOURNAL_FILE, JOURNAL_SAVING_FILE)
+
+    def compact_journal(self):
+        """Rewrites the journal as one entry per cached user, replacing any older journal files."""
+        self.journal_buffer = []
+        tmp_file = JOURNAL_FILE + ".tmp"
+        with open(tmp_file, "w") as f:
+            for guild_id, groups in self.point_cache.items():
+                for group_key, users in groups.items():
+                    for user_id, points in users.items():
+                        f.write(json.dumps({"guild_id": guild_id, "group_key": group_key, "user_id": user_id, "points": points}) + "\n")
+            f.flush()
+            os.fsync(f.fileno())
+        os.replace(tmp_file, JOURNAL_FILE)
+        if os.path.exists(JOURNAL_SAVING_FILE):
+            os.remove(JOURNAL_SAVING_FILE)
+
+    def replay_journal(self):
+        """Rebuilds the point cache from journal files left behind by a crash or redeploy."""
+        files = [f for f in (JOURNAL_SAVING_FILE, JOURNAL_FILE) if os.path.exists(f)]
+        if not files:
+            return
+
+        count = 0
+        for path in files:
+            with open(path, "r") as f:
+                for line in f:
+                    try:
+                        entry = json.loads(line)
+                    except ValueError:
+                        continue # Torn write from a crash mid-append
+
+                    if entry.get("reset"):
+                        self.point_cache.get(entry["guild_id"], {}).pop(entry["group_key"], None)
+                        continue
+
+                    self.add_points_to_cache(entry["user_id"], entry["guild_id"], entry["group_key"], entry["points"], journal=False)
+                    count += 1
+
+        try:
+            self.compact_journal()
+        except OSError as e:
+            print(f"Failed to compact point journal: {e}")
+        print(f"Replayed {count} unsaved point entries from the journal.")
+
+    async def create_leaderboard_embed(self, guild, group_key, group_data, window="all"):
         guild_id = str(guild.id)
         group_name = group_data.get('name', f"Group {group_key}")
         
         cache_entry = self.leaderboard_cache.get(guild_id, {}).get(group_key)
         
-        if not cache_entry:
+        if window != "all":
+            points_data = await self.get_window_points(guild_id, group_key, window)
+            sorted_users = sorted(points_data.items(), key=lambda x: x[1], reverse=True)
+            top_users = sorted_users[:20]
+        elif not cache_entry:
             points_data = await self.get_group_points(guild_id, group_key)
             sorted_users = sorted(points_data.items(), key=lambda x: x[1], reverse=True)
             top_users = sorted_users[:20]
@@ -203,7 +487,11 @@ class Lead(commands.Cog):
                 desc += f"{emoji} **{name}**: {points} pts\n"
         
         embed.description = desc
-        embed.set_footer(text=f"Updates every 5 minutes • Group {group_key}")
+        if window != "all":
+            embed.title += f" (Past {WINDOW_LABELS[window]})"
+            embed.set_footer(text=f"Past {WINDOW_LABELS[window]} • Group {group_key}")
+        else:
+            embed.set_footer(text=f"Updates every 5 minutes • Group {group_key}")
         return embed
 
     # --- LISTENERS ---
@@ -213,11 +501,14 @@ class Lead(commands.Cog):
         if message.author.bot or not message.guild:
             return
             
-        config = await self.get_config(message.guild.id)
-        tracked_groups = self.get_tracked_groups(message.channel, config)
+        compiled = await self.get_compiled_config(message.guild.id)
+        tracked_groups = self.get_tracked_groups(message.channel, compiled)
         
         if tracked_groups:
-            p_vals = config.get("point_values", self.DEFAULT_POINT_VALUES)
+            p_vals = compiled["point_values"]
+            if not self.allow_scoring(message.guild.id, message.author.id, p_vals):
+                return
+
             points = p_vals.get('message', 1)
             extras = (len(message.attachments) + len(message.embeds)) * p_vals.get('attachment', 2)
             total = points + extras
@@ -230,11 +521,14 @@ class Lead(commands.Cog):
         if user.bot or not reaction.message.guild:
             return
 
-        config = await self.get_config(reaction.message.guild.id)
-        tracked_groups = self.get_tracked_groups(reaction.message.channel, config)
+        compiled = await self.get_compiled_config(reaction.message.guild.id)
+        tracked_groups = self.get_tracked_groups(reaction.message.channel, compiled)
         
         if tracked_groups:
-            p_vals = config.get("point_values", self.DEFAULT_POINT_VALUES)
+            p_vals = compiled["point_values"]
+            # A throttled reactor earns nothing for either side, so reaction spam can't farm points for others
+            if not self.allow_scoring(reaction.message.guild.id, user.id, p_vals):
+                return
             
             for group_key in tracked_groups:
                 self.add_points_to_cache(user.id, reaction.message.guild.id, group_key, p_vals.get('reaction_add', 1))
@@ -282,11 +576,11 @@ class Lead(commands.Cog):
                 continue
 
             if time.time() - data['time'] >= 60.0:
-                config = await self.get_config(guild_id)
-                p_vals = config.get("point_values", self.DEFAULT_POINT_VALUES)
+                compiled = await self.get_compiled_config(guild_id)
+                p_vals = compiled["point_values"]
                 
                 channel = member.voice.channel
-                tracked_groups = self.get_tracked_groups(channel, config)
+                tracked_groups = self.get_tracked_groups(channel, compiled)
                 
                 if tracked_groups:
                     pts = p_vals.get('voice_minute', 1)
@@ -295,18 +589,69 @@ class Lead(commands.Cog):
                 
                 self.voice_tracker[user_id]['time'] = time.time()
 
+    @tasks.loop(seconds=5.0)
+    async def journal_flusher(self):
+        """Fsyncs partial batches so quiet periods don't leave deltas sitting in memory."""
+        self.flush_journal()
+
     @tasks.loop(seconds=300.0)
     async def point_saver(self):
-        if self.point_cache:
-            for guild_id, groups in self.point_cache.items():
-                for group_key, users in groups.items():
-                    for user_id, points in users.items():
-                        await self.update_user_points(guild_id, group_key, user_id, points)
-            self.point_cache = {}
+        self.expire_rate_buckets()
 
+        if self.point_cache:
+            # Swap the cache out first so points earned mid-save land in a fresh cache and journal
+            pending, self.point_cache = self.point_cache, {}
+            self.rotate_journal()
+
+            # Deltas that reached leaderboard_points: only these go into the window buckets,
+            # so a retried flush can't double count and a partial one doesn't undercount
+            saved = {}
+
+            try:
+                for guild_id, groups in pending.items():
+                    for group_key in list(groups.keys()):
+                        users = groups[group_key]
+                        for user_id in list(users.keys()):
+                            # Only drop the entry once it is written, so a failed write is put back below
+                            await self.update_user_points(guild_id, group_key, user_id, users[user_id])
+                            saved.setdefault(guild_id, {}).setdefault(group_key, {})[user_id] = users.pop(user_id)
+                        del groups[group_key]
+            except Exception as e:
+                print(f"Failed to save leaderboard points: {e}")
+                # Put back whatever didn't make it to the DB and journal it again
+                for guild_id, groups in pending.items():
+                    for group_key, users in groups.items():
+                        for user_id, points in users.items():
+                            self.add_points_to_cache(user_id, guild_id, group_key, points, journal=False)
+                try:
+                    self.compact_journal()
+                except OSError as e:
+                    print(f"Failed to compact point journal: {e}")
+            else:
+                if os.path.exists(JOURNAL_SAVING_FILE):
+                    os.remove(JOURNAL_SAVING_FILE)
+
+            if saved:
+                try:
+                    await self.add_to_buckets(saved)
+                except Exception as e:
+                    print(f"Failed to update leaderboard window buckets: {e}")
+
+        await self.refresh_leaderboards()
+
+    async def refresh_leaderboards(self):
+        """Rebuilds the top users cache and edits only the leaderboard messages whose content changed."""
         configs = self.bot.db.get_collection("leaderboard_configs")
         if isinstance(configs, list): configs = {}
 
+        # One pass over the points collection instead of one per group
+        all_points = {}
+        for doc in self.bot.db.get_collection("leaderboard_points"):
+            group_points = all_points.setdefault(doc.get("guild_id"), {}).setdefault(doc.get("group_key"), {})
+            group_points[doc["user_id"]] = doc.get("points", 0)
+
+        edits = []
+        targets = []
         for guild_id in list(configs.keys()):
             config = configs[guild_id]
             guild = self.bot.get_guild(int(guild_id))
@@ -316,7 +661,7 @@ class Lead(commands.Cog):
                 self.leaderboard_cache[guild_id] = {}
 
             for group_key, group_data in config.get("groups", {}).items():
-                points = await self.get_group_points(guild_id, group_key)
+                points = all_points.get(guild_id, {}).get(group_key, {})
                 sorted_users = sorted(points.items(), key=lambda x: x[1], reverse=True)
                 self.leaderboard_cache[guild_id][group_key] = {
                     'updated': time.time(),
@@ -324,16 +669,64 @@ class Lead(commands.Cog):
                 }
 
                 lb_info = group_data.get("last_lb_msg")
-                if lb_info:
-                    try:
-                        chan = guild.get_channel(lb_info['channel_id'])
-                        if chan:
-                            msg = await chan.fetch_message(lb_info['message_id'])
-                            embed = await self.create_leaderboard_embed(guild, group_key, group_data)
-                            await msg.edit(embed=embed)
-                    except (discord.NotFound, discord.Forbidden):
-                        group_data["last_lb_msg"] = None
-                        await self.save_config(guild_id, config)
+                if not lb_info: continue
+
+                chan = guild.get_channel(lb_info['channel_id'])
+                if not chan: continue
+
+                embed = await self.create_leaderboard_embed(guild, group_key, group_data)
+                digest = hash((lb_info['message_id'], embed.title, embed.description))
+                if self.leaderboard_hashes.get((guild_id, group_key)) == digest:
+                    continue # Nothing visible changed, skip the edit
+
+                edits.append(self.edit_leaderboard(chan, lb_info['message_id'], embed))
+                targets.append((guild_id, group_key, lb_info['message_id'], digest))
+
+        if not edits:
+            return
+
+        results = await asyncio.gather(*edits)
+
+        stale = {} # {guild_id: {group_key: message_id}} - leaderboard messages that are gone
+        for (guild_id, group_key, message_id, digest), result in zip(targets, results):
+            if result is True:
+                self.leaderboard_hashes[(guild_id, group_key)] = digest
+            elif result is False:
+                self.leaderboard_hashes.pop((guild_id, group_key), None)
+                stale.setdefault(guild_id, {})[group_key] = message_id
+
+        for guild_id, groups in stale.items():
+            # Re-read: admins may have changed the config while the edits were running
+            config = await self.get_config(guild_id)
+            changed = False
+            for group_key, message_id in groups.items():
+                group_data = config.get("groups", {}).get(group_key)
+                lb_info = group_data.get("last_lb_msg") if group_data else None
+                # Leave it alone if the group was removed or a new leaderboard was posted meanwhile
+                if lb_info and lb_info.get('message_id') == message_id:
+                    group_data["last_lb_msg"] = None
+                    changed = True
+            if changed:
+                await self.save_config(guild_id, config)
+
+    @tasks.loop(hours=1.0)
+    async def bucket_compactor(self):
+        """Rolls up and expires windowed leaderboard buckets."""
+        buckets = self.get_buckets()
+        if self.compact_buckets(buckets, time.time()):
+            self.bot.db.save_collection("leaderboard_buckets", buckets)
+
+    async def edit_leaderboard(self, channel, message_id, embed):
+        """Edits a leaderboard message without fetching it. Returns True on success, False if it's gone, None on other errors."""
+        async with self.leaderboard_edit_limiter:
+            try:
+                await channel.get_partial_message(message_id).edit(embed=embed)
+                return True
+            except (discord.NotFound, discord.Forbidden):
+                return False
+            except discord.HTTPException as e:
+                print(f"Failed to edit leaderboard message {message_id}: {e}")
+                return None
 
     # --- ADMIN SLASH COMMANDS ---
 
@@ -388,11 +781,14 @@ class Lead(commands.Cog):
             if reset:
                 # 1. Clear DB points
                 await self.clear_points_by_group(interaction.guild_id, group_key)
+                await self.clear_buckets(interaction.guild_id, group_key)
                 
-                # 2. Clear Cache
+                # 2. Clear Cache (and journal it so a replay doesn't bring the points back)
                 gid = str(interaction.guild_id)
                 if gid in self.point_cache and group_key in self.point_cache[gid]:
                     del self.point_cache[gid][group_key]
+                self.append_journal({"reset": True, "guild_id": gid, "group_key": group_key})
+                self.flush_journal()
                 
                 if gid in self.leaderboard_cache and group_key in self.leaderboard_cache[gid]:
                      del self.leaderboard_cache[gid][group_key]
@@ -446,6 +842,9 @@ class Lead(commands.Cog):
                 
                 track_str = ", ".join(tracked_names) if tracked_names else "None"
                 text += f"**[{group_key}] {g_name}**\nTracking: {track_str}\n\n"
+
+            suppressed = self.suppressed_events.get(interaction.guild_id, 0)
+            text += f"🛑 Rate-limited scoring events since restart: {suppressed}"
             
             await interaction.response.send_message(text, ephemeral=True)
 
@@ -491,12 +890,13 @@ class Lead(commands.Cog):
 
     @app_commands.command(name="setpoints", description="Configure point values for actions.")
     @app_commands.describe(
-        action_type="The action to configure",
-        value="The new point value"
+        action_type="The action to configure (rate_limit_* caps scoring events per user, 0 events = no limit)",
+        value="The new point value (events or seconds for rate_limit_*)"
     )
     @app_commands.default_permissions(administrator=True)
     async def setpoints(self, interaction: discord.Interaction, 
-                        action_type: Literal["message", "attachment", "voice_minute", "reaction_add", "reaction_receive"],
+                        action_type: Literal["message", "attachment", "voice_minute", "reaction_add", "reaction_receive",
+                                             "rate_limit_events", "rate_limit_window"],
                         value: int):
         """Configure point values for specific actions."""
         config = await self.get_config(interaction.guild_id)
@@ -505,8 +905,16 @@ class Lead(commands.Cog):
         if "point_values" not in config:
             config["point_values"] = self.DEFAULT_POINT_VALUES.copy()
             
+        if action_type.startswith("rate_limit_") and value < 0:
+            return await interaction.response.send_message("❌ Rate limit values can't be negative.", ephemeral=True)
+
         config["point_values"][action_type] = value
         await self.save_config(interaction.guild_id, config)
+
+        if action_type.startswith("rate_limit_"):
+            # Buckets were sized for the old limit
+            self.rate_buckets = {k: v for k, v in self.rate_buckets.items() if k[0] != interaction.guild_id}
+            return await interaction.response.send_message(f"✅ **{action_type}** set to **{value}**.", ephemeral=True)
         
         await interaction.response.send_message(f"✅ Points for **{action_type}** set to **{value}**.", ephemeral=True)
 
@@ -523,6 +931,7 @@ class Lead(commands.Cog):
             return await interaction.response.send_message(f"❌ Group ID {group_num} not found.", ephemeral=True)
             
         await self.update_user_points(interaction.guild_id, group_key, member.id, amount)
+        await self.add_to_buckets({str(interaction.guild_id): {group_key: {str(member.id): amount}}})
         group_name = config["groups"][group_key]["name"]
         
         # Use ephemeral=False to make it visible to everyone
@@ -540,6 +949,7 @@ class Lead(commands.Cog):
             
         neg_amount = -abs(amount)
         await self.update_user_points(interaction.guild_id, group_key, member.id, neg_amount)
+        await self.add_to_buckets({str(interaction.guild_id): {group_key: {str(member.id): neg_amount}}})
         group_name = config["groups"][group_key]["name"]
         
         # Use ephemeral=False to make it visible to everyone
@@ -548,8 +958,9 @@ class Lead(commands.Cog):
     # --- PUBLIC COMMANDS ---
 
     @app_commands.command(name="leaderboard", description="Show the leaderboard.")
-    @app_commands.describe(group_num="The Group ID (Default: 1)")
-    async def show_leaderboard(self, interaction: discord.Interaction, group_num: int = 1):
+    @app_commands.describe(group_num="The Group ID (Default: 1)", window="Time window (Default: all time)")
+    async def show_leaderboard(self, interaction: discord.Interaction, group_num: int = 1,
+                               window: Literal["all", "day", "week", "month"] = "all"):
         """Show the leaderboard."""
         if interaction.user.id != BUGGY_ID and not interaction.user.guild_permissions.administrator:
             return await interaction.response.send_message("❌ You are not authorized to use this command.", ephemeral=True)
@@ -562,7 +973,7 @@ class Lead(commands.Cog):
             if "1" in config["groups"]: group_key = "1"
             else: return await interaction.response.send_message(f"❌ Leaderboard group not found.", ephemeral=True)
 
-        embed = await self.create_leaderboard_embed(interaction.guild, group_key, config["groups"][group_key])
+        embed = await self.create_leaderboard_embed(interaction.guild, group_key, config["groups"][group_key], window)
         
         # If admin runs it, update the "pinned" message tracking
         if interaction.user.guild_permissions.administrator or interaction.user.id == BUGGY_ID:
@@ -571,6 +982,10 @@ class Lead(commands.Cog):
             
             # Send separate message into the channel
             msg = await interaction.channel.send(embed=embed)
+
+            # Windowed boards are snapshots; only the all-time board is auto-refreshed
+            if window != "all":
+                return
             
             config["groups"][group_key]["last_lb_msg"] = {
                 "channel_id": interaction.channel_id,
@@ -586,8 +1001,9 @@ class Lead(commands.Cog):
         """Check points for yourself or another user."""
         target = user or interaction.user
         config = await self.get_config(interaction.guild_id)
+        compiled = await self.get_compiled_config(interaction.guild_id)
         
-        tracked_keys = self.get_tracked_groups(interaction.channel, config)
+        tracked_keys = self.get_tracked_groups(interaction.channel, compiled)
         
         if not tracked_keys:
             # Fallback: Show ALL points if channel not tracked? 
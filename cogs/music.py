@@ -1,25 +1,47 @@
 # --- FUNCTION LIST ---
+# class SpotifyPageParser(HTMLParser): Incremental <head> parser collecting the page title and music:song track links.
 # 1. __init__(self, bot): Initializes the cog, starts tasks and YouTube services.
-# 2. cog_unload(self): Cancels background tasks when cog is unloaded.
+# 2. cog_unload(self): Cancels background tasks and closes the shared HTTP session when cog is unloaded.
 # 3. _get_secret_filename(self, slot): Returns the filename for the client secret of a given slot.
 # 4. _get_token_key(self, slot): Returns the DB key for the token of a given slot.
-# 5. execute_api_call(self, request_builder): Executes a YouTube API request with automatic rotation.
-# 6. load_config(self, guild_id): Loads music config for a specific guild from DB.
-# 7. save_config(self, guild_id, config): Saves guild config to DB.
-# 8. load_youtube_service(self): Loads all available YouTube API services from stored tokens.
-# 9. search_youtube_official(self, query): Uses the Official YouTube Data API to find a video ID.
-# 10. process_spotify_link(self, url, guild_id): Scrapes Spotify link header to find title/artist, converts to YouTube video, and adds to playlist.
-# 11. check_token_validity_task(self): Daily check for token validity.
-# 12. before_check_token(self): Waits until bot is ready before checking tokens.
-# 13. license_reminder_task(self): Checks if it's been 6 days since renewal.
-# 14. before_reminder(self): Waits until bot is ready before sending reminders.
-# 15. checkmusic(self, interaction): Checks all music API statuses.
-# 16. ytauth(self, interaction, slot): Starts the OAuth flow.
-# 17. ytcode(self, interaction, code, slot): Completes the YouTube renewal.
-# 18. playlist(self, interaction, playlist): Set the YouTube Playlist Link or ID.
-# 19. musicchannel(self, interaction, channel): Set the music sharing channel.
-# 20. removesong(self, interaction, query): Remove a song from the playlist by URL or ID.
-# 21. on_message(self, message): Listens for YouTube and Spotify links to process.
+# 5. get_http_session(self): Returns the cog's long-lived aiohttp session, creating it on first use.
+# 6. execute_api_call(self, request_builder, cost): Executes a YouTube API request on the license with the most quota left.
+# 7. get_license_usage(self, slot): Returns today's (Pacific) estimated quota usage for a license slot.
+# 8. schedule_licenses(self): Orders license slots by estimated remaining quota, skipping exhausted ones.
+# 9. load_config(self, guild_id): Loads music config for a specific guild (cached per guild).
+# 10. save_config(self, guild_id, config): Saves guild config to DB and refreshes the cache.
+# 11. load_resolution_cache(self): Loads the Spotify track -> YouTube video cache from DB (once).
+# 12. get_cached_resolution(self, track_id): Returns a fresh cached resolution for a Spotify track, or None.
+# 13. cache_resolution(self, track_id, title, video_id): Stores a resolution, evicting the least recently used.
+# 14. get_playlist_lock(self, playlist_id): Returns the lock serializing resyncs and edits of one playlist.
+# 15. get_playlist_mirror(self, playlist_id): Returns the local video_id -> playlist item mirror of a playlist.
+# 16. save_playlist_mirrors(self): Saves all playlist mirrors to DB.
+# 17. resync_playlist(self, playlist_id): Rebuilds a playlist mirror with paginated list calls.
+# 18. add_to_playlist(self, playlist_id, video_id): Inserts a video unless the mirror already has it.
+# 19. _build_license(self, slot, token_json): Blocking credential refresh + service build (runs in an executor).
+# 20. _load_license(self, slot, token_json): Builds one license slot off the event loop.
+# 21. load_youtube_service(self): Loads all available YouTube API services from stored tokens, in parallel.
+# 22. search_youtube_official(self, query): Uses the Official YouTube Data API to find a video ID.
+# 23. fetch_spotify_page(self, url): Streams a Spotify page's head through SpotifyPageParser.
+# 24. expand_spotify_collection(self, job): Queues an album/playlist's tracks within a per-link quota budget.
+# 25. resolve_spotify_link(self, url): Scrapes Spotify link header to find title/artist and converts it to a YouTube video ID.
+# 26. enqueue_insert(self, message, playlist_id, video_id, spotify_url): Queues a link for the insert worker (deduplicated).
+# 27. is_transient_error(self, error): True for errors worth retrying.
+# 28. insert_worker(self): Background task draining the insert queue.
+# 29. process_insert_job(self, job): Resolves/inserts one queued link with retry and backoff, then reacts.
+# 30. check_token_validity_task(self): Daily check for token validity.
+# 31. before_check_token(self): Waits until bot is ready before checking tokens.
+# 32. playlist_sync_task(self): Periodically resyncs every configured playlist mirror.
+# 33. before_playlist_sync(self): Waits until bot is ready before syncing playlists.
+# 34. license_reminder_task(self): Checks if it's been 6 days since renewal.
+# 35. before_reminder(self): Waits until bot is ready before sending reminders.
+# 36. checkmusic(self, interaction): Checks all music API statuses.
+# 37. ytauth(self, interaction, slot): Starts the OAuth flow.
+# 38. ytcode(self, interaction, code, slot): Completes the YouTube renewal.
+# 39. playlist(self, interaction, playlist): Set the YouTube Playlist Link or ID.
+# 40. musicchannel(self, interaction, channel): Set the music sharing channel.
+# 41. removesong(self, interaction, query): Remove a song from the playlist by URL or ID.
+# 42. on_message(self, message): Extracts every YouTube and Spotify link in one pass and queues them for insertion.
 
 import discord
 from discord.ext import commands, tasks
@@ -31,7 +53,10 @@ import re
 import datetime
 import sys
 import aiohttp
-import html
+import codecs
+from html.parser import HTMLParser
+from collections import OrderedDict
+from zoneinfo import ZoneInfo
 
 # music APIs
 from google.oauth2.credentials import Credentials
@@ -40,23 +65,105 @@ from googleapiclient.errors import HttpError
 from google.auth.transport.requests import Request
 from google_auth_oauthlib.flow import Flow
 
+# Shared HTTP session tuning (Spotify scraping)
+HTTP_TIMEOUT = aiohttp.ClientTimeout(total=15, connect=5)
+HTTP_HEADERS = {'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64)'} # Avoids basic bot blocks
+
+# YouTube quota scheduling: estimated units per call, per-license daily budget, reset at Pacific midnight
+QUOTA_COSTS = {"search": 100, "insert": 50, "delete": 50, "list": 1}
+DAILY_QUOTA = 10000
+try:
+    QUOTA_TZ = ZoneInfo("America/Los_Angeles")
+except Exception:
+    QUOTA_TZ = datetime.timezone(datetime.timedelta(hours=-8)) # No tzdata installed; PST is close enough
+
+# Spotify track -> YouTube video resolution cache (saves a 100-unit search per repeat post)
+SPOTIFY_TRACK_RE = re.compile(r'spotify\.com/track/([a-zA-Z0-9]+)')
+RESOLUTION_CACHE_TTL = 30 * 24 * 60 * 60 # Re-resolve after 30 days in case the video was taken down
+RESOLUTION_CACHE_MAX = 5000 # Entries kept before evicting the least recently used
+
+# One pass over the message for every music link: group "spotify" is the full URL, group "youtube" the video ID
+MUSIC_LINK_RE = re.compile(
+    r'(?P<spotify>https?://(?:open\.|www\.)?spotify\.com/(?:track|album|playlist|artist)/[a-zA-Z0-9_-]+)'
+    r'|https?://(?:music\.youtube\.com/watch\?v=|(?:www\.)?youtube\.com/watch\?v=|youtu\.be/)(?P<youtube>[a-zA-Z0-9_-]+)'
+)
+
+# Spotify album/playlist/artist links are expanded into their tracks, within a quota budget per link
+SPOTIFY_COLLECTION_BUDGET = 1500 # Units one link may spend (~10 uncached tracks at search + insert)
+SPOTIFY_PAGE_MAX_BYTES = 1024 * 1024 # Stop streaming a page after this much even if </head> never showed up
+SPOTIFY_CHUNK_SIZE = 16 * 1024
+
+# Returned instead of True when a video is already in the playlist (no insert spent)
+DUPLICATE = "duplicate"
+
+# Playlist insert queue: transient failures are retried with exponential backoff (2s, 4s, 8s)
+INSERT_MAX_RETRIES = 3
+INSERT_RETRY_BASE = 2
+TRANSIENT_HTTP_STATUSES = {429, 500, 502, 503, 504}
+
+class SpotifyPageParser(HTMLParser):
+    """Incremental parser for a Spotify page's <head>: collects the <title> and music:song track links."""
+    def __init__(self):
+        super().__init__(convert_charrefs=True)
+        self.title = ""
+        self.track_urls = []
+        self.done = False # Set at </head>; everything we need lives in the head
+        self._in_title = False
+        self._seen = set()
+
+    def handle_starttag(self, tag, attrs):
+        if tag == "title":
+            self._in_title = True
+        elif tag == "meta":
+            attrs = dict(attrs)
+            if "music:song" in (attrs.get("name"), attrs.get("property")):
+                url = attrs.get("content")
+                if url and url not in self._seen:
+                    self._seen.add(url)
+                    self.track_urls.append(url)
+
+    def handle_endtag(self, tag):
+        if tag == "title":
+            self._in_title = False
+        elif tag == "head":
+            self.done = True
+
+    def handle_data(self, data):
+        if self._in_title:
+            self.title += data
+
 class Music(commands.Cog):
     def __init__(self, bot):
         self.bot = bot
 
-        # List of active YouTube service objects for rotation
-        self.youtube_services = [] 
+        # Active YouTube service objects by license slot, plus estimated quota usage per slot
+        self.youtube_services = {} # {slot: service}
+        self.license_usage = {} # {slot: {"day": "YYYY-MM-DD" (Pacific), "units": int, "exhausted": bool}}
+        self.youtube_load_lock = asyncio.Lock() # Stops overlapping reloads (startup, daily check, /checkmusic)
         self.auth_flow = None
         self.auth_flow_slot = 1 # Track which slot is currently auth'ing
+        self.http_session = None # Long-lived aiohttp session (created lazily inside the event loop)
+        self.resolution_cache = None # OrderedDict {track_id: {"title", "video_id", "resolved_at"}}, LRU order
+        self.playlist_mirrors = None # {playlist_id: {"items": {video_id: {"item_id", "title"}}, "synced_at": ts}}
+        self.playlist_locks = {} # {playlist_id: asyncio.Lock} - a resync never overlaps an insert/delete on the same playlist
+        self.config_cache = {} # {guild_id: music config} - served to on_message without touching the DB
+        self.insert_queue = asyncio.Queue() # Links waiting to be resolved/inserted by insert_worker
+        self.queued_inserts = set() # {(playlist_id, video_id or spotify url)} - dedupes links already in the queue
 
         # Start services
         self.bot.loop.create_task(self.load_youtube_service())
+        self.insert_worker_task = self.bot.loop.create_task(self.insert_worker())
         self.check_token_validity_task.start()
         self.license_reminder_task.start()
+        self.playlist_sync_task.start()
 
-    def cog_unload(self):
+    async def cog_unload(self):
         self.check_token_validity_task.cancel()
         self.license_reminder_task.cancel()
+        self.playlist_sync_task.cancel()
+        self.insert_worker_task.cancel()
+        if self.http_session and not self.http_session.closed:
+            await self.http_session.close()
 
     # --- HELPERS ---
 
@@ -68,13 +175,46 @@ class Music(commands.Cog):
         """Returns the DB key for the token of a given slot."""
         return 'youtube_token_json' if slot == 1 else f'youtube_token_{slot}_json'
 
-    async def execute_api_call(self, request_builder):
+    def get_http_session(self):
+        """Returns the cog's long-lived aiohttp session so connections (TCP + TLS) are reused across links."""
+        if self.http_session is None or self.http_session.closed:
+            connector = aiohttp.TCPConnector(
+                limit=20,              # Total pooled connections
+                limit_per_host=5,
+                ttl_dns_cache=300,     # Cache DNS lookups for 5 minutes
+                keepalive_timeout=60   # Keep idle connections open between links
+            )
+            self.http_session = aiohttp.ClientSession(connector=connector, timeout=HTTP_TIMEOUT, headers=HTTP_HEADERS)
+        return self.http_session
+
+    def get_license_usage(self, slot):
+        """Returns today's (Pacific) estimated quota usage for a license slot, resetting it at midnight PT."""
+        today = datetime.datetime.now(QUOTA_TZ).date().isoformat()
+        usage = self.license_usage.get(slot)
+        if not usage or usage['day'] != today:
+            usage = {"day": today, "units": 0, "exhausted": False}
+            self.license_usage[slot] = usage
+        return usage
+
+    def schedule_licenses(self):
+        """Orders license slots by estimated remaining quota (most first), skipping exhausted ones."""
+        candidates = []
+        for slot in self.youtube_services:
+            usage = self.get_license_usage(slot)
+            if usage['exhausted']:
+                continue
+            candidates.append((DAILY_QUOTA - usage['units'], slot))
+        candidates.sort(key=lambda c: (-c[0], c[1]))
+        return [slot for _, slot in candidates]
+
+    async def execute_api_call(self, request_builder, cost=QUOTA_COSTS["list"]):
         """
-        Executes a YouTube API request with automatic rotation on quota errors.
+        Executes a YouTube API request on the license with the most estimated quota left.
         
         Args:
             request_builder: A function that takes a 'service' object and returns an executable request.
                              Example: lambda service: service.search().list(...)
+            cost: Estimated quota units the call spends (see QUOTA_COSTS).
         """
         if not self.youtube_services:
             # Try reloading if empty
@@ -83,20 +223,29 @@ class Music(commands.Cog):
                 raise Exception("No active YouTube services available.")
 
         last_error = None
-        # Try each available service in the pool
-        for i, service in enumerate(self.youtube_services):
+        for slot in self.schedule_licenses():
+            service = self.youtube_services.get(slot)
+            if not service:
+                continue # Reloaded while we were waiting on another license
+            usage = self.get_license_usage(slot)
             try:
                 request = request_builder(service)
                 # Run in executor to prevent blocking
                 loop = asyncio.get_running_loop()
-                return await loop.run_in_executor(None, request.execute)
+                response = await loop.run_in_executor(None, request.execute)
+                usage['units'] += cost
+                return response
             except HttpError as e:
-                # Check for Quota Exceeded (403)
+                # Check for Quota Exceeded (403): park this license until the Pacific midnight reset
                 if e.resp.status == 403 and 'quotaExceeded' in str(e):
-                    print(f"⚠️ Quota exceeded on License #{i+1}. Rotating...")
+                    print(f"⚠️ Quota exceeded on License Slot {slot}. Parking it until midnight PT...")
+                    usage['exhausted'] = True
+                    usage['units'] = DAILY_QUOTA
+                    last_error = e
                     continue # Try next service
 
                 # If it's not a quota error, we don't rotate, just fail
+                usage['units'] += cost
                 raise e
             except Exception as e:
                 last_error = e
@@ -107,75 +256,225 @@ class Music(commands.Cog):
         raise Exception(f"All YouTube licenses exhausted or failed. Last error: {last_error}")
 
     def load_config(self, guild_id):
-        """Loads music config for a specific guild from DB."""
-        data = self.bot.db.get_collection("music_config")
-        if isinstance(data, list): data = {} 
-
-        return data.get(str(guild_id), {
-            "playlist_id": "",
-            "music_channel_id": 0
-        })
+        """Loads music config for a specific guild (cached after the first DB read)."""
+        guild_id = str(guild_id)
+        config = self.config_cache.get(guild_id)
+        if config is None:
+            data = self.bot.db.get_collection("music_config")
+            if isinstance(data, list): data = {} 
+
+            config = data.get(guild_id, {
+                "playlist_id": "",
+                "music_channel_id": 0
+            })
+            self.config_cache[guild_id] = config
+        return config
 
     def save_config(self, guild_id, config):
-        """Saves guild config to DB."""
+        """Saves guild config to DB and refreshes the cache."""
         data = self.bot.db.get_collection("music_config")
         if isinstance(data, list): data = {}
 
         data[str(guild_id)] = config
         self.bot.db.save_collection("music_config", data)
+        self.config_cache[str(guild_id)] = config
+
+    def load_resolution_cache(self):
+        """Loads the Spotify resolution cache from DB (once), oldest-used first."""
+        if self.resolution_cache is None:
+            data = self.bot.db.get_collection("spotify_resolutions")
+            if isinstance(data, list): data = {}
+            entries = sorted(data.items(), key=lambda kv: kv[1].get('last_used', kv[1].get('resolved_at', 0)))
+            self.resolution_cache = OrderedDict(entries)
+        return self.resolution_cache
+
+    def get_cached_resolution(self, track_id):
+        """Returns a fresh cached resolution for a Spotify track, or None."""
+        cache = self.load_resolution_cache()
+        entry = cache.get(track_id)
+        if not entry:
+            return None
 
-    async def load_youtube_service(self):
-        """Loads all available YouTube API services from stored tokens."""
-        self.youtube_services = []
+        now = datetime.datetime.now().timestamp()
+        if now - entry.get('resolved_at', 0) > RESOLUTION_CACHE_TTL:
+            del cache[track_id]
+            return None
 
-        global_config = self.bot.db.get_collection("global_music_settings")
-        if isinstance(global_config, list): 
-            if global_config: global_config = global_config[0]
-            else: global_config = {}
+        # LRU bump (in memory only; persisted with the next new entry)
+        entry['last_used'] = now
+        cache.move_to_end(track_id)
+        return entry
 
-        # Check slots 1 through 5 (arbitrary limit)
-        for slot in range(1, 6):
-            secret_file = self._get_secret_filename(slot)
+    def cache_resolution(self, track_id, title, video_id):
+        """Stores a resolution, evicting the least recently used entries past the size cap."""
+        cache = self.load_resolution_cache()
+        now = datetime.datetime.now().timestamp()
+        cache[track_id] = {"title": title, "video_id": video_id, "resolved_at": now, "last_used": now}
+        cache.move_to_end(track_id)
 
-            # Skip if no secret file for this slot
-            if not os.path.exists(secret_file):
-                continue
+        while len(cache) > RESOLUTION_CACHE_MAX:
+            cache.popitem(last=False)
 
-            token_key = self._get_token_key(slot)
-            token_json = global_config.get(token_key)
+        self.bot.db.save_collection("spotify_resolutions", dict(cache))
 
-            # Fallback to local file for Slot 1 only (legacy support)
-            if slot == 1 and not token_json and os.path.exists('token.json'):
-                try:
-                    with open('token.json', 'r') as f:
-                        token_json = f.read()
-                except: pass
+    # --- PLAYLIST MIRROR ---
 
-            if token_json:
-                try:
-                    info = json.loads(token_json)
-                    creds = Credentials.from_authorized_user_info(info, ['https://www.googleapis.com/auth/youtube'])
-
-                    if creds and creds.expired and creds.refresh_token:
-                        try:
-                            creds.refresh(Request())
-                            global_config[token_key] = creds.to_json()
-                            self.bot.db.save_collection("global_music_settings", global_config)
-                        except Exception as e: 
-                            print(f"Failed to refresh token for Slot {slot}: {e}")
-                            continue
-
-                    if creds.valid:
-                        service = build('youtube', 'v3', credentials=creds)
-                        self.youtube_services.append(service)
-                        print(f"✅ Loaded YouTube License Slot {slot}")
-                except Exception as e: 
-                    print(f"Failed to load token for Slot {slot}: {e}")
+    def get_playlist_mirror(self, playlist_id):
+        """Returns the local mirror of a playlist (video_id -> playlist item), loading mirrors from DB once."""
+        if self.playlist_mirrors is None:
+            data = self.bot.db.get_collection("playlist_mirrors")
+            if isinstance(data, list): data = {}
+            self.playlist_mirrors = data
+        return self.playlist_mirrors.setdefault(playlist_id, {"items": {}, "synced_at": 0})
+
+    def save_playlist_mirrors(self):
+        self.bot.db.save_collection("playlist_mirrors", self.playlist_mirrors)
+
+    def get_playlist_lock(self, playlist_id):
+        return self.playlist_locks.setdefault(playlist_id, asyncio.Lock())
+
+    async def resync_playlist(self, playlist_id):
+        """Rebuilds a playlist mirror from the API (1 quota unit per 50 items, no page cap)."""
+        # Held across every page: an insert/delete finishing mid-resync would be lost when the mirror is swapped
+        async with self.get_playlist_lock(playlist_id):
+            items = {}
+            next_page_token = None
+            while True:
+                response = await self.execute_api_call(
+                    lambda s: s.playlistItems().list(
+                        part="id,snippet",
+                        playlistId=playlist_id,
+                        maxResults=50,
+                        pageToken=next_page_token
+                    )
+                )
+
+                for item in response.get('items', []):
+                    video_id = item['snippet']['resourceId']['videoId']
+                    items[video_id] = {"item_id": item['id'], "title": item['snippet'].get('title', '?')}
+
+                next_page_token = response.get('nextPageToken')
+                if not next_page_token: break
+
+            mirror = self.get_playlist_mirror(playlist_id)
+            mirror['items'] = items
+            mirror['synced_at'] = datetime.datetime.now().timestamp()
+            self.save_playlist_mirrors()
+            return mirror
+
+    async def add_to_playlist(self, playlist_id, video_id):
+        """Inserts a video unless the mirror already has it. Returns True if inserted, DUPLICATE if skipped."""
+        async with self.get_playlist_lock(playlist_id):
+            mirror = self.get_playlist_mirror(playlist_id)
+            if video_id in mirror['items']:
+                return DUPLICATE
+
+            response = await self.execute_api_call(
+                lambda s: s.playlistItems().insert(
+                    part="snippet",
+                    body={
+                        "snippet": {
+                            "playlistId": playlist_id,
+                            "resourceId": {"kind": "youtube#video", "videoId": video_id}
+                        }
+                    }
+                ),
+                cost=QUOTA_COSTS["insert"]
+            )
+
+            mirror['items'][video_id] = {"item_id": response['id'], "title": response.get('snippet', {}).get('title', '?')}
+            self.save_playlist_mirrors()
+            return True
+
+    # --- LICENSE LOADING ---
+
+    def _build_license(self, slot, token_json):
+        """Blocking: refreshes the credentials if needed and builds the service. Runs in an executor.
+
+        Returns (service or None, refreshed token JSON or None).
+        """
+        info = json.loads(token_json)
+        creds = Credentials.from_authorized_user_info(info, ['https://www.googleapis.com/auth/youtube'])
+
+        refreshed_json = None
+        if creds and creds.expired and creds.refresh_token:
+            try:
+                creds.refresh(Request())
+                refreshed_json = creds.to_json()
+            except Exception as e: 
+                print(f"Failed to refresh token for Slot {slot}: {e}")
+                return None, None
+
+        if not creds.valid:
+            return None, refreshed_json
+
+        # static_discovery uses the discovery document bundled with the client library:
+        # no network fetch and no parsing a downloaded document on every build
+        service = build('youtube', 'v3', credentials=creds, static_discovery=True, cache_discovery=False)
+        return service, refreshed_json
+
+    async def _load_license(self, slot, token_json):
+        """Builds one license slot off the event loop. Returns (slot, service, refreshed token JSON)."""
+        loop = asyncio.get_running_loop()
+        try:
+            service, refreshed_json = await loop.run_in_executor(None, self._build_license, slot, token_json)
+        except Exception as e: 
+            print(f"Failed to load token for Slot {slot}: {e}")
+            return slot, None, None
+
+        if service:
+            print(f"✅ Loaded YouTube License Slot {slot}")
+        return slot, service, refreshed_json
+
+    async def load_youtube_service(self):
+        """Loads all available YouTube API services from stored tokens (slots are built in parallel)."""
+        async with self.youtube_load_lock:
+            global_config = self.bot.db.get_collection("global_music_settings")
+            if isinstance(global_config, list): 
+                if global_config: global_config = global_config[0]
+                else: global_config = {}
+
+            # Check slots 1 through 5 (arbitrary limit)
+            pending = []
+            for slot in range(1, 6):
+                secret_file = self._get_secret_filename(slot)
+
+                # Skip if no secret file for this slot
+                if not os.path.exists(secret_file):
+                    continue
+
+                token_key = self._get_token_key(slot)
+                token_json = global_config.get(token_key)
+
+                # Fallback to local file for Slot 1 only (legacy support)
+                if slot == 1 and not token_json and os.path.exists('token.json'):
+                    try:
+                        with open('token.json', 'r') as f:
+                            token_json = f.read()
+                    except: pass
+
+                if token_json:
+                    pending.append(self._load_license(slot, token_json))
+
+            services = {}
+            needs_save = False
+            for slot, service, refreshed_json in await asyncio.gather(*pending):
+                if refreshed_json:
+                    global_config[self._get_token_key(slot)] = refreshed_json
+                    needs_save = True
+                if service:
+                    services[slot] = service
+
+            if needs_save:
+                self.bot.db.save_collection("global_music_settings", global_config)
+
+            # Swap in one go so calls made during a reload still see the old services
+            self.youtube_services = services
 
         return len(self.youtube_services) > 0
 
     async def search_youtube_official(self, query):
-        """Uses the Official YouTube Data API to find a video ID."""
+        """Uses the Official YouTube Data API to find a video ID. Returns None only when nothing matches."""
         try:
             # Use the wrapper to search
             response = await self.execute_api_call(
@@ -184,76 +483,192 @@ class Music(commands.Cog):
                     maxResults=1,
                     q=query,
                     type="video"
-                )
+                ),
+                cost=QUOTA_COSTS["search"]
             )
 
             if response.get('items'):
                 return response['items'][0]['id']['videoId']
         except Exception as e:
             print(f"YouTube Search Error: {e}")
-            return None
-        return None
+            # Let the insert queue decide: quota/5xx/connection errors are retried, the rest reported
+            raise
+        return None # Genuinely no results
+
+    async def fetch_spotify_page(self, url):
+        """Streams a Spotify page through SpotifyPageParser, stopping at </head>. Returns (parser, None) or (None, error)."""
+        # Pooled session keeps the connection warm
+        session = self.get_http_session()
+        async with session.get(url) as resp:
+            if resp.status in TRANSIENT_HTTP_STATUSES:
+                resp.raise_for_status() # Let the insert queue retry it
+            if resp.status != 200:
+                return None, f"Failed to fetch Spotify page (HTTP {resp.status})."
+
+            parser = SpotifyPageParser()
+            decoder = codecs.getincrementaldecoder(resp.charset or "utf-8")(errors="replace")
+            read = 0
+            # Feed chunks as they arrive instead of buffering a multi-MB page into one string
+            async for chunk in resp.content.iter_chunked(SPOTIFY_CHUNK_SIZE):
+                parser.feed(decoder.decode(chunk))
+                read += len(chunk)
+                if parser.done or read >= SPOTIFY_PAGE_MAX_BYTES:
+                    break
+
+        return parser, None
+
+    async def expand_spotify_collection(self, job):
+        """Queues the tracks of an album/playlist/artist link, stopping at the link's quota budget."""
+        message = job['message']
+        playlist_id = job['playlist_id']
+
+        page, error = await self.fetch_spotify_page(job['spotify_url'].split("?")[0])
+        if error:
+            return await message.channel.send(f"⚠️ **Error:** Spotify link failed.\n`{error}`", delete_after=10)
+
+        track_urls = [u for u in page.track_urls if SPOTIFY_TRACK_RE.search(u)]
+        if not track_urls:
+            return await message.channel.send("⚠️ **Error:** Spotify link failed.\n`Could not find any tracks on that page.`", delete_after=10)
+
+        budget = SPOTIFY_COLLECTION_BUDGET
+        mirror = self.get_playlist_mirror(playlist_id)
+        skipped = 0
+        for url in track_urls:
+            cached = self.get_cached_resolution(SPOTIFY_TRACK_RE.search(url).group(1))
+
+            # Estimate what this track will cost: nothing if already in the playlist, insert-only if resolved before
+            if cached:
+                cost = 0 if cached['video_id'] in mirror['items'] else QUOTA_COSTS["insert"]
+            else:
+                cost = QUOTA_COSTS["search"] + QUOTA_COSTS["insert"]
 
-    async def process_spotify_link(self, url, guild_id):
-        """Scrapes Spotify link to find track name, converts to YouTube video and adds to playlist."""
-        errors = []
-        if not self.youtube_services: errors.append("YouTube API not loaded.")
+            if cost > budget:
+                skipped += 1
+                continue # A later cached track may still fit
+            budget -= cost
 
-        config = self.load_config(guild_id)
-        if not config['playlist_id']: errors.append("Playlist ID not set.")
+            if cached:
+                self.enqueue_insert(message, playlist_id, video_id=cached['video_id'])
+            else:
+                self.enqueue_insert(message, playlist_id, spotify_url=url)
 
-        if errors:
-            return "Setup Errors:\n" + "\n".join([f"- {e}" for e in errors])
+        if skipped:
+            await message.channel.send(
+                f"⚠️ Queued {len(track_urls) - skipped} of {len(track_urls)} tracks; the rest would go over the quota budget for one link.",
+                delete_after=15
+            )
 
+    async def resolve_spotify_link(self, url):
+        """Scrapes a Spotify track link and finds its YouTube video. Returns (video_id, None) or (None, error)."""
         clean_url = url.split("?")[0]
+        track_match = SPOTIFY_TRACK_RE.search(clean_url)
+        track_id = track_match.group(1) if track_match else None
 
-        try:
-            # 1. Fetch the Spotify webpage to scrape the title
-            async with aiohttp.ClientSession() as session:
-                # Add a user-agent to avoid basic bot blocks
-                headers = {'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64)'}
-                async with session.get(clean_url, headers=headers) as resp:
-                    if resp.status != 200:
-                        return f"Failed to fetch Spotify page (HTTP {resp.status})."
-                    html_content = await resp.text()
-
-            # Find the title tag
-            title_match = re.search(r'<title.*?>(.*?)</title>', html_content, re.IGNORECASE)
-            if not title_match:
-                return "Could not extract title from Spotify page."
-
-            # Clean up the scraped title for our YouTube search
-            raw_title = html.unescape(title_match.group(1))
-            search_query = raw_title.replace(" | Spotify", "").replace(" - song and lyrics by ", " ").replace(" - song by ", " ")
-            
-            # 2. Search on YouTube
-            video_id = await self.search_youtube_official(search_query)
-
-            if not video_id: 
-                return f"Could not find '{search_query}' on YouTube."
-
-            # 3. Add to YouTube Playlist (Using Rotation)
+        cached = self.get_cached_resolution(track_id) if track_id else None
+        if cached:
+            # Seen this track before: no scrape, no search quota
+            return cached['video_id'], None
+
+        # 1. Fetch the Spotify webpage to scrape the title
+        page, error = await self.fetch_spotify_page(clean_url)
+        if error:
+            return None, error
+
+        if not page.title.strip():
+            return None, "Could not extract title from Spotify page."
+
+        # Clean up the scraped title for our YouTube search
+        raw_title = page.title.strip()
+        search_query = raw_title.replace(" | Spotify", "").replace(" - song and lyrics by ", " ").replace(" - song by ", " ")
+        
+        # 2. Search on YouTube
+        video_id = await self.search_youtube_official(search_query)
+
+        if not video_id: 
+            return None, f"Could not find '{search_query}' on YouTube."
+
+        if track_id:
+            self.cache_resolution(track_id, search_query, video_id)
+        return video_id, None
+
+    # --- INSERT QUEUE ---
+
+    def enqueue_insert(self, message, playlist_id, video_id=None, spotify_url=None):
+        """Queues a link for insertion. Returns False if the same link is already waiting."""
+        key = (playlist_id, video_id or spotify_url.split("?")[0])
+        if key in self.queued_inserts:
+            return False
+
+        self.queued_inserts.add(key)
+        self.insert_queue.put_nowait({
+            "key": key,
+            "message": message,
+            "playlist_id": playlist_id,
+            "video_id": video_id,
+            "spotify_url": spotify_url,
+            "attempts": 0
+        })
+        return True
+
+    def is_transient_error(self, error):
+        """True for errors worth retrying: rate limits, 5xx responses and connection problems."""
+        if isinstance(error, HttpError):
+            return error.resp.status in TRANSIENT_HTTP_STATUSES
+        if isinstance(error, aiohttp.ClientResponseError):
+            return error.status in TRANSIENT_HTTP_STATUSES
+        return isinstance(error, (aiohttp.ClientError, asyncio.TimeoutError, ConnectionError))
+
+    async def insert_worker(self):
+        """Drains the insert queue one job at a time so bursts of links never hold up on_message."""
+        while True:
+            job = await self.insert_queue.get()
             try:
-                await self.execute_api_call(
-                    lambda s: s.playlistItems().insert(
-                        part="snippet",
-                        body={
-                            "snippet": {
-                                "playlistId": config['playlist_id'],
-                                "resourceId": {
-                                    "kind": "youtube#video", 
-                                    "videoId": video_id
-                                }
-                            }
-                        }
-                    )
-                )
-                return True
+                await self.process_insert_job(job)
             except Exception as e:
-                return f"YouTube API Error: {e}"
+                print(f"[music] Insert job failed unexpectedly: {e}")
+                self.queued_inserts.discard(job['key'])
+            finally:
+                self.insert_queue.task_done()
 
+    async def process_insert_job(self, job):
+        """Resolves (Spotify) and inserts one queued link, then reacts to the original message."""
+        message = job['message']
+        source = "Spotify" if job['spotify_url'] else "YouTube"
+
+        try:
+            if self.youtube_services and not self.schedule_licenses():
+                # Every license is parked until midnight PT; don't spend a failing request finding out
+                raise Exception("All YouTube licenses are out of quota until midnight PT.")
+
+            if job['spotify_url'] and not SPOTIFY_TRACK_RE.search(job['spotify_url']):
+                # Album/playlist/artist: fan out into track jobs (they react to the message themselves)
+                await self.expand_spotify_collection(job)
+                self.queued_inserts.discard(job['key'])
+                return
+
+            if not job['video_id']:
+                video_id, error = await self.resolve_spotify_link(job['spotify_url'])
+                if error:
+                    self.queued_inserts.discard(job['key'])
+                    return await message.channel.send(f"⚠️ **Error:** {source} link failed.\n`{error}`", delete_after=10)
+                job['video_id'] = video_id # Retries skip the scrape/search
+
+            result = await self.add_to_playlist(job['playlist_id'], job['video_id'])
         except Exception as e:
-            return f"Unknown Error: {e}"
+            if self.is_transient_error(e) and job['attempts'] < INSERT_MAX_RETRIES:
+                delay = INSERT_RETRY_BASE * 2 ** job['attempts']
+                job['attempts'] += 1
+                asyncio.get_running_loop().call_later(delay, self.insert_queue.put_nowait, job)
+                return
+
+            self.queued_inserts.discard(job['key'])
+            return await message.channel.send(f"⚠️ **Error:** {source} link failed.\n`{e}`", delete_after=10)
+
+        self.queued_inserts.discard(job['key'])
+        try:
+            await message.add_reaction("🎵" if result is True else "🔁")
+        except discord.HTTPException:
+            pass # Message was deleted while it sat in the queue
 
     # --- TASKS ---
 
@@ -268,6 +683,28 @@ class Music(commands.Cog):
     async def before_check_token(self):
         await self.bot.wait_until_ready()
 
+    @tasks.loop(hours=12)
+    async def playlist_sync_task(self):
+        """Resyncs every configured playlist mirror to pick up changes made outside the bot."""
+        if not self.youtube_services: return
+
+        data = self.bot.db.get_collection("music_config")
+        if isinstance(data, list): data = {}
+
+        playlist_ids = {c.get('playlist_id') for c in data.values() if c.get('playlist_id')}
+        for playlist_id in playlist_ids:
+            try:
+                mirror = await self.resync_playlist(playlist_id)
+                print(f"[music] Synced playlist {playlist_id}: {len(mirror['items'])} items")
+            except Exception as e:
+                print(f"[music] Failed to sync playlist {playlist_id}: {e}")
+
+    @playlist_sync_task.before_loop
+    async def before_playlist_sync(self):
+        await self.bot.wait_until_ready()
+        # Give load_youtube_service a head start
+        await asyncio.sleep(30)
+
     @tasks.loop(hours=1)
     async def license_reminder_task(self):
         """Checks if it's been 6 days since renewal."""
@@ -312,6 +749,14 @@ class Music(commands.Cog):
         count = len(self.youtube_services)
 
         yt_msg = f"✅ **YouTube:** {count} Active License(s)" if count > 0 else "❌ **YouTube:** No Licenses."
+
+        # Estimated quota per license (counters reset at midnight Pacific)
+        for slot in sorted(self.youtube_services):
+            usage = self.get_license_usage(slot)
+            if usage['exhausted']:
+                yt_msg += f"\n• Slot {slot}: 🚫 Exhausted until midnight PT"
+            else:
+                yt_msg += f"\n• Slot {slot}: ~{usage['units']}/{DAILY_QUOTA} units used today"
         
         await interaction.response.send_message(f"{yt_msg}", ephemeral=True)
 
@@ -372,7 +817,9 @@ class Music(commands.Cog):
             return await interaction.response.send_message(f"❌ You started auth for Slot {self.auth_flow_slot}, but submitted for Slot {slot}. Please match them.", ephemeral=True)
 
         try:
-            self.auth_flow.fetch_token(code=code)
+            # Token exchange is a blocking HTTP call
+            loop = asyncio.get_running_loop()
+            await loop.run_in_executor(None, lambda: self.auth_flow.fetch_token(code=code))
 
             # Save Token for specific slot
             global_config = self.bot.db.get_collection("global_music_settings")
@@ -448,41 +895,32 @@ class Music(commands.Cog):
              return await interaction.followup.send("❌ Could not parse Video ID from query.")
 
         try:
-            next_page_token = None
-            target_item_id = None
-            video_title = "?"
-
-            # Limit to 5 pages to save quota
-            for _ in range(5):
-                response = await self.execute_api_call(
-                    lambda s: s.playlistItems().list(
-                        part="id,snippet",
-                        playlistId=playlist_id,
-                        maxResults=50,
-                        pageToken=next_page_token
-                    )
-                )
+            mirror = self.get_playlist_mirror(playlist_id)
+            entry = mirror['items'].get(video_id)
 
-                for item in response.get('items', []):
-                    if item['snippet']['resourceId']['videoId'] == video_id:
-                        target_item_id = item['id']
-                        video_title = item['snippet']['title']
-                        break
-
-                if target_item_id: break
+            # Never synced (or added outside the bot): refresh the mirror once before giving up
+            if not entry:
+                mirror = await self.resync_playlist(playlist_id)
+                entry = mirror['items'].get(video_id)
 
-                next_page_token = response.get('nextPageToken')
-                if not next_page_token: break
+            if not entry:
+                return await interaction.followup.send(f"❌ Video ID `{video_id}` not found in the playlist.")
 
-            if not target_item_id:
-                return await interaction.followup.send(f"❌ Video ID `{video_id}` not found in the first 250 items of the playlist.")
+            # Delete it (locked so a resync can't swap the mirror out from under the edit)
+            async with self.get_playlist_lock(playlist_id):
+                try:
+                    await self.execute_api_call(
+                        lambda s: s.playlistItems().delete(id=entry['item_id']),
+                        cost=QUOTA_COSTS["delete"]
+                    )
+                except HttpError as e:
+                    if e.resp.status != 404: raise e
+                    # Already gone on YouTube's side; just fix the mirror
 
-            # Delete it
-            await self.execute_api_call(
-                lambda s: s.playlistItems().delete(id=target_item_id)
-            )
+                self.get_playlist_mirror(playlist_id)['items'].pop(video_id, None)
+                self.save_playlist_mirrors()
 
-            await interaction.followup.send(f"✅ Removed **{video_title}** from the playlist.")
+            await interaction.followup.send(f"✅ Removed **{entry.get('title', '?')}** from the playlist.")
 
         except Exception as e:
             await interaction.followup.send(f"❌ Error removing song: {e}")
@@ -493,47 +931,42 @@ class Music(commands.Cog):
     async def on_message(self, message):
         if message.author.bot or not message.guild: return
 
+        # Cheap prefilter: almost no messages contain a music link, so skip them before any other work
+        content = message.content
+        if "spotify.com" not in content and "youtu" not in content:
+            return
+
         config = self.load_config(message.guild.id)
         if config['music_channel_id'] != 0 and message.channel.id != config['music_channel_id']:
             return
 
-        content = message.content
-        spotify_match = re.search(r'(https?://(?:open\.|www\.)?spotify\.com/(?:track|album|playlist|artist)/[a-zA-Z0-9_-]+)', content)
-        yt_music_match = re.search(r'https?://music\.youtube\.com/watch\?v=([a-zA-Z0-9_-]+)', content)
-        yt_standard_match = re.search(r'https?://(?:www\.)?youtube\.com/watch\?v=([a-zA-Z0-9_-]+)', content)
-        yt_short_match = re.search(r'https?://youtu\.be/([a-zA-Z0-9_-]+)', content)
+        spotify_urls = []
+        video_ids = []
+        for match in MUSIC_LINK_RE.finditer(content):
+            if match.group('spotify'):
+                spotify_urls.append(match.group('spotify'))
+            else:
+                video_ids.append(match.group('youtube'))
 
         # 1. Handle Spotify
-        if spotify_match:
-            result = await self.process_spotify_link(spotify_match.group(1), message.guild.id)
-            if result is True:
-                await message.add_reaction("🎵")
-            else:
-                await message.channel.send(f"⚠️ **Error:** Spotify link failed.\n`{result}`", delete_after=10)
+        if spotify_urls:
+            errors = []
+            if not self.youtube_services: errors.append("YouTube API not loaded.")
+            if not config['playlist_id']: errors.append("Playlist ID not set.")
 
-        # 2. Handle YouTube
-        elif self.youtube_services and (yt_music_match or yt_standard_match or yt_short_match):
-            v_id = None
-            if yt_music_match: v_id = yt_music_match.group(1)
-            elif yt_standard_match: v_id = yt_standard_match.group(1)
-            elif yt_short_match: v_id = yt_short_match.group(1)
+            if errors:
+                error = "Setup Errors:\n" + "\n".join([f"- {e}" for e in errors])
+                await message.channel.send(f"⚠️ **Error:** Spotify link failed.\n`{error}`", delete_after=10)
+                return
 
-            if v_id:
-                try:
-                    await self.execute_api_call(
-                        lambda s: s.playlistItems().insert(
-                            part="snippet",
-                            body={
-                                "snippet": {
-                                    "playlistId": config['playlist_id'],
-                                    "resourceId": {"kind": "youtube#video", "videoId": v_id}
-                                }
-                            }
-                        )
-                    )
-                    await message.add_reaction("🎵")
-                except Exception as e:
-                    await message.channel.send(f"⚠️ **Error:** YouTube link failed.\n`{e}`", delete_after=10)
+            # The insert worker resolves, inserts and reacts; the listener returns right away
+            for url in spotify_urls:
+                self.enqueue_insert(message, config['playlist_id'], spotify_url=url)
+
+        # 2. Handle YouTube
+        if self.youtube_services:
+            for v_id in video_ids:
+                self.enqueue_insert(message, config['playlist_id'], video_id=v_id)
 
 async def setup(bot):
     await bot.add_cog(Music(bot))
\ No newline at end of file
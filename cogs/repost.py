@@ -0,0 +1,300 @@
+import discord
+import asyncio
+import datetime
+import heapq
+import time
+
+# Function/Class List:
+# class RepostSlot
+# - __init__(owner, channel_id, message_id, posted_at)
+# class RepostEngine
+# - __init__(bot)
+# - register(owner, channel_id, message_id, posted_at)
+# - unregister(owner, channel_id)
+# - unregister_all(owner)
+# - get_slot(owner, channel_id)
+# - on_message(message)
+# - trigger(channel, slot, now)
+# - schedule(channel_id, slot, delay, reset)
+# - spawn(coro)
+# - task_done(task)
+# - ensure_timer()
+# - run_timers()
+# - fire_repost(channel_id, slot)
+# - repost(channel, slot)
+# - flush_dirty(channel)
+# get_engine(bot)
+# setup(bot)
+
+# Shared "keep this message at the bottom of the channel" engine used by Stickies and Alert Dashboards.
+#
+# Owners (a cog, or one object per alert dashboard) register the channels they post in and implement:
+#   repost_key                       - unique short name, e.g. "sticky", "alert_{guild_id}_{name}"
+#   get_repost_timing(channel)       - (mode, delay) with mode "before" (cooldown), "throttle" (cooldown that catches up
+#                                      once it ends) or "after" (delay), or None if paused
+#   build_repost(channel)  [async]   - kwargs for channel.send(), or None to skip
+#   on_reposted(channel, message)    - persist the new message ID / timestamp
+
+class RepostSlot:
+    """Engine-side state for one owner's message in one channel."""
+    __slots__ = ("owner", "channel_id", "message_id", "posted_at", "dirty")
+
+    def __init__(self, owner, channel_id, message_id=None, posted_at=0):
+        self.owner = owner
+        self.channel_id = channel_id
+        self.message_id = message_id
+        self.posted_at = posted_at or 0
+        self.dirty = False # Someone talked while we were reposting: go once more afterwards
+
+class RepostEngine:
+    def __init__(self, bot):
+        self.bot = bot
+        self.channels = {}       # {channel_id: {repost_key: RepostSlot}} - the only lookup done per message
+        # "After" mode timers: one scheduler task for every channel instead of a task per message.
+        # A message only moves its deadline in the dict; the heap entry is re-armed lazily when it pops.
+        self.deadlines = {}      # {(channel_id, repost_key): monotonic fire time}
+        self.timer_heap = []     # [(fire_at, channel_id, repost_key)]
+        self.timer_wakeup = asyncio.Event()
+        self.timer_task = None
+        self.locks = {}          # {channel_id: asyncio.Lock} - one delete/send pipeline per channel
+        self.reposting = set()   # {channel_id} - ignore messages while we are posting (they are ours)
+        self.tasks = set()       # Running fire_repost/trigger tasks, referenced until they finish
+
+        # One listener for every owner
+        bot.add_listener(self.on_message, "on_message")
+
+    # --- REGISTRATION ---
+
+    def register(self, owner, channel_id, message_id=None, posted_at=0):
+        """Starts (or refreshes) tracking an owner's message in a channel."""
+        channel_id = int(channel_id)
+        slots = self.channels.setdefault(channel_id, {})
+        slot = slots.get(owner.repost_key)
+        if slot:
+            slot.owner = owner
+            slot.message_id = message_id
+            slot.posted_at = posted_at or 0
+        else:
+            slot = slots[owner.repost_key] = RepostSlot(owner, channel_id, message_id, posted_at)
+        return slot
+
+    def unregister(self, owner, channel_id):
+        """Stops tracking an owner in a channel and cancels its pending repost."""
+        channel_id = int(channel_id)
+        slots = self.channels.get(channel_id)
+        if not slots: return
+
+        slots.pop(owner.repost_key, None)
+        # Stale heap entries are dropped when they pop
+        self.deadlines.pop((channel_id, owner.repost_key), None)
+
+        if not slots:
+            del self.channels[channel_id]
+            self.locks.pop(channel_id, None)
+
+    def unregister_all(self, owner):
+        """Drops every channel an owner registered (used on cog unload)."""
+        for channel_id in [c for c, slots in self.channels.items() if owner.repost_key in slots]:
+            self.unregister(owner, channel_id)
+
+    def get_slot(self, owner, channel_id):
+        return self.channels.get(int(channel_id), {}).get(owner.repost_key)
+
+    # --- EVENTS ---
+
+    async def on_message(self, message):
+        """Single on_message for every repost owner: one dict lookup for channels with nothing registered."""
+        if not message.guild: return
+
+        slots = self.channels.get(message.channel.id)
+        if not slots: return
+
+        # Safety Lock Check: our own messages arriving while we post are the reposts themselves.
+        # Anyone else talking mid-repost is coalesced into a single follow-up once we finish.
+        if message.channel.id in self.reposting:
+            if message.author.id != self.bot.user.id:
+                for slot in slots.values():
+                    slot.dirty = True
+            return
+
+        # Ignore OTHER bots, but allow our own bot to push the messages down
+        if message.author.bot and message.author.id != self.bot.user.id:
+            return
+
+        # One of our own tracked messages (e.g. the sticky just posted above a dashboard)
+        if any(slot.message_id == message.id for slot in slots.values()):
+            return
+
+        now = datetime.datetime.now().timestamp()
+        for slot in list(slots.values()):
+            await self.trigger(message.channel, slot, now)
+
+    async def trigger(self, channel, slot, now):
+        """Applies the owner's timing mode to one new message."""
+        timing = slot.owner.get_repost_timing(channel)
+        if not timing: return
+        mode, delay = timing
+
+        # LOGIC 1: AFTER (Delay/Silence)
+        if mode == "after" and delay > 0:
+            # Reset the silence timer
+            self.schedule(channel.id, slot, delay)
+            return
+
+        # LOGIC 2: BEFORE (Cooldown) / THROTTLE (Cooldown + one trailing repost)
+        if mode in ("before", "throttle") and delay > 0:
+            remaining = delay - (now - slot.posted_at)
+            if remaining > 0:
+                if mode == "throttle":
+                    # Coalesce every message inside the cooldown into one repost when it ends,
+                    # so the last burst doesn't leave the message buried
+                    self.schedule(channel.id, slot, remaining, reset=False)
+                return
+
+        # Immediate Repost (Delay=0 or cooldown passed)
+        await self.repost(channel, slot)
+
+    # --- REPOST PIPELINE ---
+
+    def schedule(self, channel_id, slot, delay, reset=True):
+        """Sets (or pushes back, if reset) the deadline for a delayed repost. O(1) while a timer is already armed."""
+        key = (channel_id, slot.owner.repost_key)
+        fire_at = time.monotonic() + delay
+        old = self.deadlines.get(key)
+
+        # Cooldown repost already coming up: this message rides along with it
+        if old is not None and not reset:
+            return
+
+        self.deadlines[key] = fire_at
+
+        # Already armed for an earlier time: run_timers re-arms it when that entry pops
+        if old is not None and old <= fire_at:
+            return
+
+        heapq.heappush(self.timer_heap, (fire_at, channel_id, slot.owner.repost_key))
+        if self.timer_heap[0][0] == fire_at:
+            # New earliest deadline: wake the scheduler so it sleeps for the right amount
+            self.timer_wakeup.set()
+        self.ensure_timer()
+
+    def spawn(self, coro):
+        """Starts a background task and keeps it referenced until it is done, so it can't be garbage-collected."""
+        task = asyncio.create_task(coro)
+        self.tasks.add(task)
+        task.add_done_callback(self.task_done)
+        return task
+
+    def task_done(self, task):
+        self.tasks.discard(task)
+        if not task.cancelled() and task.exception():
+            print(f"Repost task failed: {task.exception()}")
+
+    def ensure_timer(self):
+        if self.timer_task is None or self.timer_task.done():
+            self.timer_task = asyncio.create_task(self.run_timers())
+
+    async def run_timers(self):
+        """The single scheduler loop: sleeps until the earliest deadline and fires whatever has expired."""
+        while self.timer_heap:
+            fire_at, channel_id, repost_key = self.timer_heap[0]
+            wait = fire_at - time.monotonic()
+            if wait > 0:
+                self.timer_wakeup.clear()
+                try:
+                    await asyncio.wait_for(self.timer_wakeup.wait(), timeout=wait)
+                except asyncio.TimeoutError:
+                    pass
+                continue
+
+            heapq.heappop(self.timer_heap)
+            key = (channel_id, repost_key)
+            deadline = self.deadlines.get(key)
+            if deadline is None:
+                continue # Unregistered or already fired
+
+            if deadline > fire_at:
+                # More messages arrived since this entry was armed: re-arm for the latest deadline
+                heapq.heappush(self.timer_heap, (deadline, channel_id, repost_key))
+                continue
+
+            del self.deadlines[key]
+            slot = self.channels.get(channel_id, {}).get(repost_key)
+            if slot:
+                self.spawn(self.fire_repost(channel_id, slot))
+
+    async def fire_repost(self, channel_id, slot):
+        """Reposts once a channel's silence deadline has passed."""
+        try:
+            # Re-fetch channel to ensure freshness after the wait
+            channel = self.bot.get_channel(channel_id)
+            if not channel:
+                try:
+                    channel = await self.bot.fetch_channel(channel_id)
+                except (discord.NotFound, discord.Forbidden, discord.HTTPException):
+                    pass
+
+            if channel:
+                await self.repost(channel, slot)
+            else:
+                print(f"Could not find channel {channel_id} to repost {slot.owner.repost_key}.")
+        except Exception as e:
+            print(f"Error in fire_repost: {e}")
+
+    async def repost(self, channel, slot):
+        """Deletes the owner's old message and posts a new one at the bottom."""
+        lock = self.locks.setdefault(channel.id, asyncio.Lock())
+        async with lock:
+            # Unregistered while we waited for the lock
+            if self.channels.get(channel.id, {}).get(slot.owner.repost_key) is not slot:
+                return
+
+            # Already the newest message in the channel: nothing to move
+            if slot.message_id and channel.last_message_id == slot.message_id:
+                return
+
+            self.reposting.add(channel.id)
+            try:
+                payload = await slot.owner.build_repost(channel)
+                if not payload: return
+
+                # Delete the old message by ID (no fetch) while the new one is being sent
+                sends = [channel.send(**payload)]
+                if slot.message_id:
+                    sends.append(channel.get_partial_message(slot.message_id).delete())
+                results = await asyncio.gather(*sends, return_exceptions=True)
+
+                # A failed delete (already gone / no perms) is fine, a failed send is not
+                new_msg = results[0]
+                if isinstance(new_msg, BaseException):
+                    print(f"Failed to repost {slot.owner.repost_key} in {channel.id}: {new_msg}")
+                    return
+
+                slot.message_id = new_msg.id
+                slot.posted_at = datetime.datetime.now().timestamp()
+                slot.owner.on_reposted(channel, new_msg)
+            finally:
+                # Always release the lock so the next message can trigger it
+                self.reposting.discard(channel.id)
+
+        self.flush_dirty(channel)
+
+    def flush_dirty(self, channel):
+        """Runs the one follow-up repost owed to messages that arrived mid-repost."""
+        now = datetime.datetime.now().timestamp()
+        for slot in list(self.channels.get(channel.id, {}).values()):
+            if slot.dirty:
+                slot.dirty = False
+                self.spawn(self.trigger(channel, slot, now))
+
+def get_engine(bot):
+    """Returns the bot-wide RepostEngine, creating it on first use (shared by every cog and survives reloads)."""
+    engine = getattr(bot, "repost_engine", None)
+    if engine is None:
+        engine = RepostEngine(bot)
+        bot.repost_engine = engine
+    return engine
+
+async def setup(bot):
+    # Not a cog: loading this extension just makes sure the engine exists
+    get_engine(bot)
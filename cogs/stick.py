@@ -1,33 +1,52 @@
 import discord
 from discord.ext import commands
 from discord import app_commands
-import asyncio
 import datetime
 from typing import Literal
+from cogs.repost import get_engine
 
 # Function/Class List:
 # class Stickies(commands.Cog)
 # - __init__(bot)
+# - cog_load()
+# - cog_unload()
 # - get_stickies()
 # - save_stickies(stickies)
 # - get_sticky_settings()
 # - save_sticky_settings(settings)
-# - send_sticky(channel)
-# - sticky_task(channel, delay)
-# - handle_sticky(message)
-# - on_message(message)
+# - get_contents(sticky)
+# - build_embeds(contents)
+# - load_stickies()
+# - resolve_timing(channel_id)
+# - save_sticky(sticky)
+# - delete_sticky(channel_id)
+# - get_repost_timing(channel) [Repost Engine]
+# - build_repost(channel) [Repost Engine]
+# - on_reposted(channel, message) [Repost Engine]
 # - on_message_delete(message)
 # - sticky(interaction, action, message) [Slash]
-# - stickytime(interaction, timing, number, unit) [Slash]
+# - stickytime(interaction, timing, number, unit, scope) [Slash]
 # setup(bot)
 
+DEFAULT_STICKY_TIMING = ("after", 0) # (mode, delay) when neither the sticky nor the server sets one
+MAX_STICKIES_PER_CHANNEL = 10 # Discord allows 10 embeds per message
+
 class Stickies(commands.Cog):
     def __init__(self, bot):
         self.bot = bot
         self.description = "Manage sticky messages."
-        self.pending_tasks = {} # {channel_id: asyncio.Task}
-        self.reposting = set()  # {channel_id} - Safety lock to prevent race conditions
-        self.in_memory_last_stickies = {} # {channel_id: message_id} - Prevents spam loop
+        self.repost_key = "sticky"
+        self.stickies = {} # {channel_id: sticky record} - in-memory index of sticky_messages
+        self.guild_timings = {} # {guild_id: (mode, delay)} - server defaults from sticky_settings
+        self.sticky_timings = {} # {channel_id: (mode, delay)} - resolved: the sticky's own timing, else the server default
+        # Timing, locking and the delete/send pipeline live in the shared repost engine
+        self.engine = get_engine(bot)
+
+    async def cog_load(self):
+        self.load_stickies()
+
+    async def cog_unload(self):
+        self.engine.unregister_all(self)
 
     # --- HELPERS ---
 
@@ -47,183 +66,122 @@ class Stickies(commands.Cog):
         """Saves sticky settings."""
         self.bot.db.save_collection("sticky_settings", settings)
 
-    async def send_sticky(self, channel):
-        """Actually sends the sticky message."""
-        # Safety Lock: Prevent concurrent sends in the same channel
-        if channel.id in self.reposting:
+    def get_contents(self, sticky):
+        """Returns every message stuck in a channel (older records only have 'content')."""
+        if sticky.get('contents'):
+            return sticky['contents']
+        return [sticky['content']] if sticky.get('content') else []
+
+    def build_embeds(self, contents):
+        return [discord.Embed(description=c, color=discord.Color(0xff90aa)) for c in contents]
+
+    def load_stickies(self):
+        """Builds the channel index once and registers every sticky channel with the repost engine."""
+        self.guild_timings = {}
+        for s in self.get_sticky_settings():
+            self.guild_timings[int(s.get('guild_id', 0))] = (s.get('mode', 'after'), s.get('delay', 0))
+
+        self.stickies = {}
+        self.sticky_timings = {}
+        for s in self.get_stickies():
+            channel_id = int(s.get('channel_id', 0))
+            if not channel_id: continue
+            self.stickies[channel_id] = s
+            self.resolve_timing(channel_id)
+            self.engine.register(self, channel_id, s.get('last_message_id'), s.get('last_posted_at', 0))
+
+    def resolve_timing(self, channel_id):
+        """Caches the timing a sticky channel uses: its own mode/delay, else the server default."""
+        sticky = self.stickies.get(channel_id)
+        if not sticky:
+            self.sticky_timings.pop(channel_id, None)
             return
 
-        self.reposting.add(channel.id)
-        try:
+        if sticky.get('mode') is not None and sticky.get('delay') is not None:
+            self.sticky_timings[channel_id] = (sticky['mode'], sticky['delay'])
+        else:
+            self.sticky_timings[channel_id] = self.guild_timings.get(int(sticky.get('guild_id', 0)), DEFAULT_STICKY_TIMING)
+
+    def save_sticky(self, sticky):
+        """Persists one sticky record (keyed by channel) and keeps the index in sync."""
+        channel_id = int(sticky['channel_id'])
+        self.stickies[channel_id] = sticky
+        self.resolve_timing(channel_id)
+        updated = self.bot.db.update_doc("sticky_messages", "channel_id", sticky['channel_id'], sticky)
+        if not updated:
             stickies = self.get_stickies()
-            sticky_data = next((s for s in stickies if int(s.get('channel_id', 0)) == channel.id), None)
-            
-            if not sticky_data: return
-
-            # Check in-memory cache first to avoid DB latency issues causing double posting
-            if channel.last_message_id == self.in_memory_last_stickies.get(channel.id) or \
-               channel.last_message_id == sticky_data.get('last_message_id'):
-                 return
-
-            # Delete old sticky
-            old_id = self.in_memory_last_stickies.get(channel.id) or sticky_data.get('last_message_id')
-            if old_id:
-                try:
-                    old_msg = await channel.fetch_message(old_id)
-                    await old_msg.delete()
-                except (discord.NotFound, discord.HTTPException):
-                    pass
-            
-            # Send new sticky
-            try:
-                embed = discord.Embed(description=sticky_data['content'], color=discord.Color(0xff90aa))
-                new_msg = await channel.send(embed=embed)
-                
-                # UPDATE IN-MEMORY CACHE IMMEDIATELY
-                self.in_memory_last_stickies[channel.id] = new_msg.id
-                
-                sticky_data['last_message_id'] = new_msg.id
-                sticky_data['last_posted_at'] = datetime.datetime.now().timestamp()
-                sticky_data['active'] = True
-
-                # Manually save to DB to bypass any update_doc issues
-                stickies = self.get_stickies()
-                for i, s in enumerate(stickies):
-                    if int(s.get('channel_id', 0)) == channel.id:
-                        stickies[i] = sticky_data
-                        break
-                self.save_stickies(stickies)
+            stickies.append(sticky)
+            self.save_stickies(stickies)
 
-            except Exception as e:
-                print(f"Failed to send sticky: {e}")
-        finally:
-            # Always release the lock so the next message can trigger it
-            self.reposting.discard(channel.id)
-
-    async def sticky_task(self, channel, delay):
-        """Waits for delay then sends sticky."""
-        try:
-            await asyncio.sleep(delay)
-            # Re-fetch channel to ensure freshness
-            if not channel: return
-            
-            await self.send_sticky(channel)
-        except asyncio.CancelledError:
-            pass
-        finally:
-            if channel.id in self.pending_tasks:
-                del self.pending_tasks[channel.id]
-
-    async def handle_sticky(self, message):
-        """Resends the sticky message to the bottom."""
-        stickies = self.get_stickies()
-        sticky_data = next((s for s in stickies if int(s.get('channel_id', 0)) == message.channel.id), None)
-        
+    def delete_sticky(self, channel_id):
+        """Removes a sticky from the index, the repost engine and the DB."""
+        sticky = self.stickies.pop(int(channel_id), None)
+        self.sticky_timings.pop(int(channel_id), None)
+        self.engine.unregister(self, channel_id)
+        self.bot.db.delete_doc("sticky_messages", "channel_id", sticky['channel_id'] if sticky else channel_id)
+
+    # --- REPOST ENGINE HOOKS ---
+
+    def get_repost_timing(self, channel):
+        """Returns (mode, delay) for a sticky channel, or None if the sticky is paused."""
+        sticky_data = self.stickies.get(channel.id)
+        if not sticky_data or not sticky_data.get('active', True): return None
+        return self.sticky_timings.get(channel.id, DEFAULT_STICKY_TIMING)
+
+    async def build_repost(self, channel):
+        """Builds the channel's sticky embeds (all of them, in one message) for the engine to send."""
+        sticky_data = self.stickies.get(channel.id)
+        if not sticky_data: return None
+
+        contents = self.get_contents(sticky_data)
+        if not contents: return None
+        return {"embeds": self.build_embeds(contents)}
+
+    def on_reposted(self, channel, message):
+        """Saves the new sticky message ID after the engine reposts it."""
+        sticky_data = self.stickies.get(channel.id)
         if not sticky_data: return
 
-        # Get Settings for delay
-        settings = self.get_sticky_settings()
-        guild_setting = next((s for s in settings if int(s.get('guild_id', 0)) == message.guild.id), None)
-        
-        delay = 0
-        mode = "after" # Default behavior
-        if guild_setting:
-            delay = guild_setting.get('delay', 0)
-            mode = guild_setting.get('mode', 'after')
-
-        now = datetime.datetime.now().timestamp()
-
-        # LOGIC 1: BEFORE (Cooldown)
-        if mode == "before":
-            if delay > 0:
-                last_posted = sticky_data.get('last_posted_at', 0)
-                if (now - last_posted) < delay:
-                    return
-            # If cooldown passed or delay is 0, send immediately
-            await self.send_sticky(message.channel)
-
-        # LOGIC 2: AFTER (Delay/Silence)
-        elif mode == "after":
-            if delay > 0:
-                # Cancel existing task (reset timer)
-                if message.channel.id in self.pending_tasks:
-                    self.pending_tasks[message.channel.id].cancel()
-                
-                # Start new task
-                self.pending_tasks[message.channel.id] = asyncio.create_task(
-                    self.sticky_task(message.channel, delay)
-                )
-            else:
-                # No delay, send immediately
-                await self.send_sticky(message.channel)
+        update = {
+            "last_message_id": message.id,
+            "last_posted_at": datetime.datetime.now().timestamp(),
+            "active": True
+        }
+        sticky_data.update(update)
+        self.bot.db.update_doc("sticky_messages", "channel_id", sticky_data['channel_id'], update)
 
     # --- EVENTS ---
 
-    @commands.Cog.listener()
-    async def on_message(self, message):
-        """Handles sticky message triggering."""
-        if not message.guild: return
-        
-        # Safety Lock Check: Prevent the sticky message itself from triggering an infinite loop
-        # If we are currently in the middle of sending the sticky, ignore messages
-        if message.channel.id in self.reposting:
-            return
-
-        # Ignore OTHER bots, but allow our own bot (buggybot) to trigger the sticky to move down
-        if message.author.bot and message.author.id != self.bot.user.id:
-            return
-
-        stickies = self.get_stickies()
-        sticky_data = next((s for s in stickies if int(s.get('channel_id', 0)) == message.channel.id), None)
-        
-        if sticky_data:
-            if not sticky_data.get('active', True): return
-            
-            # SPAM FIX: Check against our instant in-memory cache first!
-            if self.in_memory_last_stickies.get(message.channel.id) == message.id:
-                return
-            
-            # Final safeguard fallback to database check
-            if sticky_data.get('last_message_id') == message.id: return
-
-            await self.handle_sticky(message)
-
     @commands.Cog.listener()
     async def on_message_delete(self, message):
-        """Prevents log spam if a sticky is deleted by the bot logic."""
-        pass
+        """Forgets a sticky message that was deleted, so the engine doesn't treat it as still being at the bottom."""
+        slot = self.engine.get_slot(self, message.channel.id)
+        if slot and slot.message_id == message.id:
+            slot.message_id = None
 
     # --- SLASH COMMANDS ---
 
     @app_commands.command(name="sticky", description="Manage sticky messages.")
-    @app_commands.describe(action="Choose an action", message="The message content (Required for Add)")
+    @app_commands.describe(action="Choose an action", message="The message content (Required for Add), or the number of the sticky to Remove")
     @app_commands.default_permissions(administrator=True)
     async def sticky(self, interaction: discord.Interaction, action: Literal["Add", "List", "Remove"], message: str = None):
         """Manage sticky messages."""
-        
+
         if action == "List":
-            stickies = self.get_stickies()
-            current_guild_stickies = [s for s in stickies if int(s.get('guild_id', 0)) == interaction.guild_id]
+            current_guild_stickies = [s for s in self.stickies.values() if int(s.get('guild_id', 0)) == interaction.guild_id]
 
             if not current_guild_stickies:
                 return await interaction.response.send_message("📝 No sticky messages found for this server.", ephemeral=True)
 
             valid_stickies = []
-            needs_save = False
 
-            # Check for deleted channels and filter them out
+            # Check for deleted channels and purge them from the database
             for s in current_guild_stickies:
                 channel = interaction.guild.get_channel(int(s.get('channel_id', 0)))
                 if channel:
                     valid_stickies.append(s)
                 else:
-                    needs_save = True
-
-            # If we found stickies belonging to deleted channels, purge them from the database
-            if needs_save:
-                valid_channel_ids = [int(s.get('channel_id', 0)) for s in valid_stickies]
-                stickies = [s for s in stickies if int(s.get('guild_id', 0)) != interaction.guild_id or int(s.get('channel_id', 0)) in valid_channel_ids]
-                self.save_stickies(stickies)
+                    self.delete_sticky(s['channel_id'])
 
             if not valid_stickies:
                 return await interaction.response.send_message("📝 No sticky messages found for this server.", ephemeral=True)
@@ -238,96 +196,190 @@ class Stickies(commands.Cog):
             for s in valid_stickies:
                 channel = interaction.guild.get_channel(int(s.get('channel_id', 0)))
                 chan_mention = channel.mention # Safe since we verified it exists above
-                content_preview = s['content'].replace("\n", " ")
                 status = " (Paused)" if not s.get('active', True) else ""
-                if len(content_preview) > 50: content_preview = content_preview[:47] + "..."
-                text += f"• {chan_mention}{status}: {content_preview}\n"
-            
+                if s.get('mode') is not None and s.get('delay') is not None:
+                    status += f" ⏱️ {s['mode']} {s['delay']}s"
+
+                contents = self.get_contents(s)
+                for i, content in enumerate(contents, start=1):
+                    content_preview = content.replace("\n", " ")
+                    if len(content_preview) > 50: content_preview = content_preview[:47] + "..."
+                    number = f"`{i}.` " if len(contents) > 1 else ""
+                    if i == 1:
+                        text += f"• {chan_mention}{status}: {number}{content_preview}\n"
+                    else:
+                        text += f"  {number}{content_preview}\n"
+
             return await interaction.response.send_message(text, ephemeral=True)
-        
+
         if action == "Remove":
-            stickies = self.get_stickies()
-            target = next((s for s in stickies if int(s.get('channel_id', 0)) == interaction.channel_id), None)
-            
-            if target:
-                if target.get('last_message_id'):
+            target = self.stickies.get(interaction.channel_id)
+
+            if not target:
+                return await interaction.response.send_message("❌ No sticky message found in this channel.", ephemeral=True)
+
+            contents = list(self.get_contents(target))
+
+            # Remove a single sticky out of several, keeping the rest in place
+            if message and len(contents) > 1:
+                if not message.isdigit() or not 1 <= int(message) <= len(contents):
+                    return await interaction.response.send_message(f"❌ Pick a sticky number between 1 and {len(contents)} (see `/sticky List`).", ephemeral=True)
+
+                contents.pop(int(message) - 1)
+                target['contents'] = contents
+                self.bot.db.update_doc("sticky_messages", "channel_id", target['channel_id'], {"contents": contents})
+
+                slot = self.engine.get_slot(self, interaction.channel_id)
+                if slot and slot.message_id:
                     try:
-                        old_msg = await interaction.channel.fetch_message(target['last_message_id'])
-                        await old_msg.delete()
+                        await interaction.channel.get_partial_message(slot.message_id).edit(embeds=self.build_embeds(contents))
                     except: pass
-                
-                # Clear from memory cache if it exists
-                if interaction.channel_id in self.in_memory_last_stickies:
-                    del self.in_memory_last_stickies[interaction.channel_id]
-
-                stickies = [s for s in stickies if int(s.get('channel_id', 0)) != interaction.channel_id]
-                self.save_stickies(stickies)
-                await interaction.response.send_message("✅ Sticky message removed.", ephemeral=True)
-            else:
-                await interaction.response.send_message("❌ No sticky message found in this channel.", ephemeral=True)
+                return await interaction.response.send_message(f"✅ Sticky #{message} removed.", ephemeral=True)
+
+            # Stop the engine first so a pending repost can't bring it back
+            slot = self.engine.get_slot(self, interaction.channel_id)
+            old_id = (slot.message_id if slot else None) or target.get('last_message_id')
+            self.delete_sticky(interaction.channel_id)
+
+            if old_id:
+                try:
+                    await interaction.channel.get_partial_message(old_id).delete()
+                except: pass
+
+            await interaction.response.send_message("✅ Sticky message removed.", ephemeral=True)
             return
 
         if not message:
             return await interaction.response.send_message(f"❌ You must provide a message to {action} a sticky!", ephemeral=True)
 
         content = message.replace("\\n", "\n")
-        existing = next((s for s in self.get_stickies() if int(s.get('channel_id', 0)) == interaction.channel_id), None)
+        existing = self.stickies.get(interaction.channel_id)
 
         if action == "Add":
             if existing:
-                return await interaction.response.send_message("⚠️ A sticky message already exists in this channel. Remove it first to set a new one.", ephemeral=True)
-            
+                contents = list(self.get_contents(existing))
+                if len(contents) >= MAX_STICKIES_PER_CHANNEL:
+                    return await interaction.response.send_message(f"⚠️ This channel already has {MAX_STICKIES_PER_CHANNEL} stickies. Remove one first.", ephemeral=True)
+
+                # Combine into the channel's existing sticky message
+                contents.append(content)
+                existing['contents'] = contents
+                self.bot.db.update_doc("sticky_messages", "channel_id", existing['channel_id'], {"contents": contents})
+
+                # Acknowledge first: a repost may have to wait for the channel lock
+                await interaction.response.defer(ephemeral=True)
+
+                slot = self.engine.get_slot(self, interaction.channel_id)
+                edited = False
+                if slot and slot.message_id:
+                    try:
+                        await interaction.channel.get_partial_message(slot.message_id).edit(embeds=self.build_embeds(contents))
+                        edited = True
+                    except discord.NotFound:
+                        # Deleted by someone: forget it, or the engine would think it's still at the bottom
+                        slot.message_id = None
+                    except (discord.Forbidden, discord.HTTPException):
+                        pass
+
+                # Old message is gone: post the combined sticky fresh
+                if not edited and slot:
+                    await self.engine.repost(interaction.channel, slot)
+                    if not slot.message_id:
+                        return await interaction.followup.send("⚠️ Sticky saved, but I couldn't post it. It will show up after the next message.", ephemeral=True)
+
+                return await interaction.followup.send(f"✅ Sticky added! This channel now has **{len(contents)}** stickies.", ephemeral=True)
+
             new_sticky = {
                 "channel_id": interaction.channel_id,
                 "guild_id": interaction.guild_id,
-                "content": content,
+                "contents": [content],
                 "last_message_id": None,
                 "last_posted_at": datetime.datetime.now().timestamp(),
                 "active": True
             }
-            
-            stickies = self.get_stickies()
-            stickies.append(new_sticky)
-            self.save_stickies(stickies)
+
+            self.save_sticky(new_sticky)
 
             try:
-                embed = discord.Embed(description=content, color=discord.Color(0xff90aa))
-                msg = await interaction.channel.send(embed=embed)
-                
-                self.in_memory_last_stickies[interaction.channel_id] = msg.id
+                msg = await interaction.channel.send(embeds=self.build_embeds(new_sticky['contents']))
+
+                self.engine.register(self, interaction.channel_id, msg.id, new_sticky['last_posted_at'])
                 new_sticky['last_message_id'] = msg.id
-                
-                # Fetch stickies again to be safe and save it with the real message ID
-                stickies = self.get_stickies()
-                for i, s in enumerate(stickies):
-                    if int(s.get('channel_id', 0)) == interaction.channel_id:
-                        stickies[i] = new_sticky
-                        break
-                self.save_stickies(stickies)
-                
+
+                # Save it with the real message ID
+                self.bot.db.update_doc("sticky_messages", "channel_id", interaction.channel_id, {"last_message_id": msg.id})
+
                 await interaction.response.send_message("✅ Sticky message added!", ephemeral=True)
             except Exception as e:
+                # Still saved: register it so the next message in the channel posts it
+                self.engine.register(self, interaction.channel_id)
                 await interaction.response.send_message(f"❌ Failed to send sticky: {e}", ephemeral=True)
 
-    @app_commands.command(name="stickytime", description="Configure server-wide sticky message timing.")
-    @app_commands.describe(timing="Mode: 'before' (Cooldown) or 'after' (Delay)", number="Time amount", unit="Time unit")
+    @app_commands.command(name="stickytime", description="Configure sticky message timing for the server or this channel.")
+    @app_commands.describe(timing="Mode: 'before' (Cooldown), 'throttle' (Cooldown, reposts once it ends) or 'after' (Delay)", number="Time amount (not needed to reset)", unit="Time unit (default: seconds)", scope="Server default, or only this channel's sticky")
     @app_commands.choices(
-        timing=[app_commands.Choice(name="Before (Cooldown)", value="before"), app_commands.Choice(name="After (Delay)", value="after")],
-        unit=[app_commands.Choice(name="Seconds", value="seconds"), app_commands.Choice(name="Minutes", value="minutes")]
+        timing=[
+            app_commands.Choice(name="Before (Cooldown)", value="before"),
+            app_commands.Choice(name="Throttle (Cooldown, then catch up)", value="throttle"),
+            app_commands.Choice(name="After (Delay)", value="after")
+        ],
+        unit=[app_commands.Choice(name="Seconds", value="seconds"), app_commands.Choice(name="Minutes", value="minutes")],
+        scope=[
+            app_commands.Choice(name="Server default", value="server"),
+            app_commands.Choice(name="This channel", value="channel"),
+            app_commands.Choice(name="This channel: use server default", value="reset")
+        ]
     )
     @app_commands.default_permissions(administrator=True)
-    async def stickytime(self, interaction: discord.Interaction, timing: app_commands.Choice[str], number: int, unit: app_commands.Choice[str]):
-        """Configure server-wide sticky message timing."""
-        multiplier = 60 if unit.value == 'minutes' else 1
+    async def stickytime(self, interaction: discord.Interaction, timing: app_commands.Choice[str] = None, number: int = None, unit: app_commands.Choice[str] = None, scope: app_commands.Choice[str] = None):
+        """Configure sticky message timing."""
+        scope_value = scope.value if scope else "server"
+
+        # --- PER-CHANNEL RESET (takes no timing) ---
+        if scope_value == "reset":
+            target = self.stickies.get(interaction.channel_id)
+            if not target:
+                return await interaction.response.send_message("❌ No sticky message found in this channel.", ephemeral=True)
+
+            update = {"mode": None, "delay": None}
+            target.update(update)
+            self.bot.db.update_doc("sticky_messages", "channel_id", target['channel_id'], update)
+            self.resolve_timing(interaction.channel_id)
+            return await interaction.response.send_message("✅ This channel's sticky now follows the server timing.", ephemeral=True)
+
+        if timing is None or number is None:
+            return await interaction.response.send_message("❌ Please give a `timing` and a `number` (and optionally a `unit`).", ephemeral=True)
+
+        multiplier = 60 if unit and unit.value == 'minutes' else 1
         total_seconds = number * multiplier
-        
+
+        delay_text = "Instant (0s)" if total_seconds == 0 else f"{total_seconds} seconds"
+        mode_text = {"before": "Cooldown (Before)", "throttle": "Throttle (Cooldown, then catch up)"}.get(timing.value, "Delay (After)")
+
+        # --- PER-CHANNEL ---
+        if scope_value == "channel":
+            target = self.stickies.get(interaction.channel_id)
+            if not target:
+                return await interaction.response.send_message("❌ No sticky message found in this channel.", ephemeral=True)
+
+            update = {"mode": timing.value, "delay": total_seconds}
+            target.update(update)
+            self.bot.db.update_doc("sticky_messages", "channel_id", target['channel_id'], update)
+            self.resolve_timing(interaction.channel_id)
+            return await interaction.response.send_message(f"✅ Sticky settings updated for this channel.\nMode: **{mode_text}**\nTime: **{delay_text}**", ephemeral=True)
+
+        # --- SERVER DEFAULT ---
         settings = self.get_sticky_settings()
         settings = [s for s in settings if int(s.get('guild_id', 0)) != interaction.guild_id]
         settings.append({"guild_id": interaction.guild_id, "delay": total_seconds, "mode": timing.value})
         self.save_sticky_settings(settings)
-        
-        delay_text = "Instant (0s)" if total_seconds == 0 else f"{total_seconds} seconds"
-        mode_text = "Cooldown (Before)" if timing.value == "before" else "Delay (After)"
+
+        # Re-resolve this server's stickies (channels with their own timing keep it)
+        self.guild_timings[interaction.guild_id] = (timing.value, total_seconds)
+        for channel_id, s in self.stickies.items():
+            if int(s.get('guild_id', 0)) == interaction.guild_id:
+                self.resolve_timing(channel_id)
+
         await interaction.response.send_message(f"✅ Sticky settings updated.\nMode: **{mode_text}**\nTime: **{delay_text}**", ephemeral=True)
 
 async def setup(bot):
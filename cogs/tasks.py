@@ -4,25 +4,46 @@ from discord import app_commands
 import json
 import os
 import asyncio
+import time
 from typing import Literal
 
 # List of functions/classes in this file:
+# class TaskButton(discord.ui.DynamicItem):
+#   - __init__(self, action)
+#   - from_custom_id(cls, interaction, item, match)
+#   - callback(self, interaction)
+# def unpack_state(state)
 # class TaskView(discord.ui.View):
 #   - __init__(self, cog, user_id, total, state=None, message_id=None)
+#   - completed(self) [Property]
+#   - todo(self) [Property]
+#   - pack_state(self)
 #   - get_emoji_bar(self) [UPDATED]
+#   - get_content(self)
 #   - update_message(self, interaction, finished=False, congratulation=None) [UPDATED]
+#   - schedule_save(self)
+#   - save_later(self)
 #   - update_db(self)
-#   - get_next_index(self)
+#   - cancel_save(self)
+#   - mark_next(self, mark)
 #   - check_completion(self, interaction)
 #   - finish_logic(self, interaction) [UPDATED]
-#   - done_button(self, interaction, button)
-#   - skip_button(self, interaction, button)
-#   - undo_button(self, interaction, button)
-#   - finish_button(self, interaction, button)
+#   - done_action(self, interaction)
+#   - skip_action(self, interaction)
+#   - undo_action(self, interaction)
+#   - finish_action(self, interaction)
 # class Tasks(commands.Cog, name="tasks"):
 #   - __init__(self, bot)
 #   - cog_load(self)
-#   - restore_views(self)
+#   - cog_unload(self)
+#   - load_active_tasks(self)
+#   - get_active_task(self, guild_id, user_id)
+#   - get_active_task_by_message(self, message_id)
+#   - add_active_task(self, doc)
+#   - update_active_task(self, message_id, data)
+#   - delete_active_task(self, message_id)
+#   - get_task_view(self, message_id)
+#   - retire_view(self, message_id)
 #   - get_task_channel_id(self, guild_id)
 #   - tasks(interaction, action, number) [Slash]
 #   - progress(interaction) [Slash]
@@ -31,31 +52,108 @@ from typing import Literal
 
 # Collections: "tasks_active", "tasks_config"
 
+# Seconds without clicks before a task list's state is written to tasks_active
+TASK_SAVE_DELAY = 5
+
+# Button custom_id suffix -> (label, style). The custom_ids are shared by every task list,
+# so clicks are routed to the right list by message ID (see TaskButton / Tasks.get_task_view).
+TASK_BUTTONS = {
+    "done": ("Done", discord.ButtonStyle.success),
+    "skip": ("Skip", discord.ButtonStyle.primary),
+    "undo": ("Undo", discord.ButtonStyle.secondary),
+    "finish": ("Close", discord.ButtonStyle.secondary),
+}
+
+class TaskButton(discord.ui.DynamicItem[discord.ui.Button], template=r"bb_(?P<action>done|skip|undo|finish)"):
+    def __init__(self, action):
+        label, style = TASK_BUTTONS[action]
+        super().__init__(discord.ui.Button(label=label, style=style, custom_id=f"bb_{action}"))
+        self.action = action
+
+    @classmethod
+    async def from_custom_id(cls, interaction, item, match):
+        return cls(match['action'])
+
+    async def callback(self, interaction: discord.Interaction):
+        """Looks up (or lazily rebuilds) the clicked task list and runs the action on it."""
+        cog = interaction.client.get_cog("tasks")
+        view = cog.get_task_view(interaction.message.id) if cog else None
+        if not view:
+            return await interaction.response.send_message("This task list isn't active anymore!", ephemeral=True)
+
+        if interaction.user.id != view.user_id:
+            return await interaction.response.send_message("This isn't your list, buggy!", ephemeral=True)
+
+        await getattr(view, f"{self.action}_action")(interaction)
+
+def unpack_state(state):
+    """Decodes a stored task state into the completed-prefix marks (b"1" = Done, b"2" = Skipped).
+
+    Tasks are always completed front to back and Undo only reverts the last one, so a list is
+    a run of Done/Skipped marks followed by Todo. The DB keeps just that run as a digit string;
+    older docs stored the full list of state codes.
+    """
+    if not state:
+        return bytearray()
+    if isinstance(state, str):
+        return bytearray(state, "ascii")
+
+    # Legacy list: [1, 2, 1, 0, 0, ...] (3 only appears on finished lists, read it as a skip)
+    marks = bytearray()
+    for code in state:
+        if code == 0: break
+        marks.append(ord("1") if code == 1 else ord("2"))
+    return marks
+
 class TaskView(discord.ui.View):
     def __init__(self, cog, user_id, total, state=None, message_id=None):
         super().__init__(timeout=None) # Persistent
         self.cog = cog
         self.user_id = user_id
         self.total = total
-        # State Codes: 0 = White (Todo), 1 = Green (Done), 2 = Blue (Skipped Manual), 3 = Blue (Skipped Auto/Closed)
-        self.state = state if state else [0] * total
+        # Completed tasks in order: b"1" = Green (Done), b"2" = Blue (Skipped Manual). Everything after is Todo.
+        self.marks = unpack_state(state)[:total]
+        # Counters kept in step with every click, so nothing is recounted on render
+        self.done = self.marks.count(b"1")
+        self.skipped = len(self.marks) - self.done
+        self.closed = 0 # Blue (Skipped Auto/Closed): the Todo left over when the list is closed
         self.message_id = message_id
-        self.history = [] # Stack for Undo
+        self.undo_depth = 0 # Clicks made through this view that Undo may revert
+        # Debounced saving: clicks only touch memory, one write goes out once the user pauses
+        self.dirty = False
+        self.changed_at = 0
+        self.save_task = None
+
+        for action in TASK_BUTTONS:
+            self.add_item(TaskButton(action))
+
+    @property
+    def completed(self):
+        return self.done + self.skipped + self.closed
+
+    @property
+    def todo(self):
+        return self.total - self.completed
+
+    def pack_state(self):
+        """The compact form stored in tasks_active: one digit per completed task."""
+        return self.marks.decode("ascii")
 
     def get_emoji_bar(self):
         if self.total == 0: return ""
-        
+
         # Grid Size: 16 Columns x 2 Rows = 32 Squares total
         cols = 16
         rows = 2
         total_visual_blocks = cols * rows
-        
+
         visual_state = []
-        
-        # Sort state for visualization: 
+
+        # Visual order comes straight from the counters (no sorting):
         # Manual Skipped (2) -> Done (1) -> Todo (0) -> Auto Skipped/Closed (3)
-        sort_key = {2: 0, 1: 1, 0: 2, 3: 3}
-        sorted_state = sorted(self.state, key=lambda x: sort_key.get(x, 4))
+        skip_end = self.skipped
+        done_end = skip_end + self.done
+        todo_end = done_end + self.todo
 
         # Create a visual representation by repeating task states proportionally
         current_visual_count = 0
@@ -63,11 +161,14 @@ class TaskView(discord.ui.View):
             # Calculate how many visual blocks this task should take up
             target_visual_count = int((i + 1) * total_visual_blocks / self.total)
             blocks_for_this_task = target_visual_count - current_visual_count
-            
-            # Use the sorted state here so colors are grouped
-            visual_state.extend([sorted_state[i]] * blocks_for_this_task)
+
+            if i < skip_end: val = 2
+            elif i < done_end: val = 1
+            elif i < todo_end: val = 0
+            else: val = 3
+            visual_state.extend([val] * blocks_for_this_task)
             current_visual_count += blocks_for_this_task
-            
+
         # Safety check to ensure exactly 32 blocks
         if len(visual_state) < total_visual_blocks:
             visual_state.extend([0] * (total_visual_blocks - len(visual_state)))
@@ -82,26 +183,27 @@ class TaskView(discord.ui.View):
         # Construct the 2 rows string
         row0 = "-# "
         row1 = "-# "
-        
+
         for i in range(total_visual_blocks):
             val = visual_state[i]
             if val == 1: sym = SYM_DONE
             elif val == 2: sym = SYM_SKIP
             elif val == 3: sym = SYM_SKIP # 3 (Auto Skip) is also Blue
             else: sym = SYM_TODO
-            
+
             if i % 2 == 0:
                 row0 += sym
             else:
                 row1 += sym
-                
+
         return f"{row0}\n{row1}"
 
+    def get_content(self):
+        return f"<@{self.user_id}>'s tasks: {self.completed}/{self.total}\n{self.get_emoji_bar()}"
+
     async def update_message(self, interaction, finished=False, congratulation=None):
-        # Count 1 (Done), 2 (Manual Skip), 3 (Auto Skip)
-        completed_tasks = self.state.count(1) + self.state.count(2) + self.state.count(3)
-        content = f"<@{self.user_id}>'s tasks: {completed_tasks}/{self.total}\n{self.get_emoji_bar()}"
-        
+        content = self.get_content()
+
         view = self
         if finished:
             if congratulation:
@@ -114,40 +216,72 @@ class TaskView(discord.ui.View):
                  await interaction.edit_original_response(content=content, view=view)
             else:
                  await interaction.response.edit_message(content=content, view=view)
-        
-        # DB Update
+
+        # DB Update (after the reply, so the click never waits on it)
         if finished:
-            # Use main DB method
-            self.cog.bot.db.delete_doc("tasks_active", "message_id", self.message_id)
+            # The list is gone: drop any pending save and the doc itself
+            self.cancel_save()
+            self.cog.views.pop(self.message_id, None)
+            self.cog.delete_active_task(self.message_id)
         else:
-            await self.update_db()
-
-    async def update_db(self):
-        if self.message_id:
-            # Update 'state' in 'tasks_active' collection where message_id matches
-            self.cog.bot.db.update_doc("tasks_active", "message_id", self.message_id, {"state": self.state})
-
-    def get_next_index(self):
+            self.schedule_save()
+
+    def schedule_save(self):
+        """Marks the state unsaved and pushes the write back until clicking stops for TASK_SAVE_DELAY."""
+        if not self.message_id: return
+        self.dirty = True
+        self.changed_at = time.monotonic()
+        # One sleeper per view; later clicks just move changed_at forward
+        if self.save_task is None or self.save_task.done():
+            self.save_task = asyncio.create_task(self.save_later())
+
+    async def save_later(self):
+        while True:
+            wait = self.changed_at + TASK_SAVE_DELAY - time.monotonic()
+            if wait <= 0: break
+            await asyncio.sleep(wait)
+        self.update_db()
+
+    def update_db(self):
+        """Writes the latest state now (no-op if nothing changed since the last write)."""
+        if not self.dirty or not self.message_id: return
+        self.dirty = False
         try:
-            return self.state.index(0)
-        except ValueError:
-            return -1
+            # Update the packed 'state' in 'tasks_active' where message_id matches
+            self.cog.update_active_task(self.message_id, {"state": self.pack_state()})
+        except Exception as e:
+            print(f"Failed to save task state for {self.message_id}: {e}")
+
+    def cancel_save(self):
+        """Forgets unsaved changes (the caller writes or deletes the doc itself)."""
+        self.dirty = False
+        if self.save_task and not self.save_task.done():
+            self.save_task.cancel()
+
+    def mark_next(self, mark):
+        """Completes the next Todo task with b"1" (Done) or b"2" (Skipped). False if none are left."""
+        if self.todo <= 0:
+            return False
+        self.marks += mark
+        if mark == b"1": self.done += 1
+        else: self.skipped += 1
+        self.undo_depth += 1
+        return True
 
     async def check_completion(self, interaction):
-        if 0 not in self.state:
+        if self.todo <= 0:
             await self.finish_logic(interaction)
         else:
             await self.update_message(interaction)
 
     async def finish_logic(self, interaction):
-        # 1. Convert remaining '0' (Todo) to '3' (Auto Skipped/Closed)
-        # We use 3 instead of 2 so they can be sorted to the right side visually
-        self.state = [3 if x == 0 else x for x in self.state]
-        
-        # 2. Calculate score (Only '1's count towards the percentage)
-        greens = [x for x in self.state if x == 1]
-        percent_complete = int((len(greens) / self.total) * 100) if self.total > 0 else 0
-        
+        # 1. Convert remaining Todo to Auto Skipped/Closed
+        # Counted apart from manual skips so they can be drawn on the right side visually
+        self.closed += self.todo
+
+        # 2. Calculate score (Only Done counts towards the percentage)
+        percent_complete = int((self.done / self.total) * 100) if self.total > 0 else 0
+
         # Fetch celebration messages from config
         # Config structure: {guild_id: {task_channel_id, celebratory_messages}}
         guild_id = str(interaction.guild_id)
@@ -169,51 +303,28 @@ class TaskView(discord.ui.View):
         
         await self.update_message(interaction, finished=True, congratulation=celebration)
 
-    # --- BUTTONS ---
-    
-    @discord.ui.button(label="Done", style=discord.ButtonStyle.success, custom_id="bb_done")
-    async def done_button(self, interaction: discord.Interaction, button: discord.ui.Button):
-        if interaction.user.id != self.user_id:
-            return await interaction.response.send_message("This isn't your list, buggy!", ephemeral=True)
-        
-        idx = self.get_next_index()
-        if idx == -1:
-            return await self.finish_logic(interaction)
+    # --- BUTTON ACTIONS (called by TaskButton after the owner check) ---
 
-        self.history.append((idx, 0))
-        self.state[idx] = 1 # Green (Done)
+    async def done_action(self, interaction):
+        if not self.mark_next(b"1"): # Green (Done)
+            return await self.finish_logic(interaction)
         await self.check_completion(interaction)
 
-    @discord.ui.button(label="Skip", style=discord.ButtonStyle.primary, custom_id="bb_skip")
-    async def skip_button(self, interaction: discord.Interaction, button: discord.ui.Button):
-        if interaction.user.id != self.user_id:
-            return await interaction.response.send_message("This isn't your list, buggy!", ephemeral=True)
-
-        idx = self.get_next_index()
-        if idx == -1:
+    async def skip_action(self, interaction):
+        if not self.mark_next(b"2"): # Blue (Skipped Manual)
             return await self.finish_logic(interaction)
-
-        self.history.append((idx, 0))
-        self.state[idx] = 2 # Blue (Skipped Manual)
         await self.check_completion(interaction)
 
-    @discord.ui.button(label="Undo", style=discord.ButtonStyle.secondary, custom_id="bb_undo")
-    async def undo_button(self, interaction: discord.Interaction, button: discord.ui.Button):
-        if interaction.user.id != self.user_id:
-            return await interaction.response.send_message("This isn't your list, buggy!", ephemeral=True)
-        
-        if not self.history:
+    async def undo_action(self, interaction):
+        if not self.undo_depth or not self.marks:
             return await interaction.response.send_message("Nothing to undo!", ephemeral=True)
 
-        last_idx, last_val = self.history.pop()
-        self.state[last_idx] = last_val
+        if self.marks.pop() == ord("1"): self.done -= 1
+        else: self.skipped -= 1
+        self.undo_depth -= 1
         await self.update_message(interaction)
 
-    @discord.ui.button(label="Close", style=discord.ButtonStyle.secondary, custom_id="bb_finish")
-    async def finish_button(self, interaction: discord.Interaction, button: discord.ui.Button):
-        if interaction.user.id != self.user_id:
-            return await interaction.response.send_message("This isn't your list, buggy!", ephemeral=True)
-
+    async def finish_action(self, interaction):
         await self.finish_logic(interaction)
 
 
@@ -223,33 +334,98 @@ class Tasks(commands.Cog, name="tasks"):
 
     def __init__(self, bot):
         self.bot = bot
+        self.views = {} # {message_id: TaskView} - lists clicked (or posted) this session
+        # tasks_active indexes, so lookups don't scan every user's list
+        self.active_by_user = {}    # {(guild_id, user_id): doc}
+        self.active_by_message = {} # {message_id: doc}
 
     async def cog_load(self):
-        # Restore views logic
-        asyncio.create_task(self.restore_views())
+        # No views are restored at startup: task buttons are matched by custom_id
+        # and each list is rebuilt from the index the first time it's clicked
+        self.load_active_tasks()
+        self.bot.add_dynamic_items(TaskButton)
+
+    async def cog_unload(self):
+        self.bot.remove_dynamic_items(TaskButton)
+        # Shutdown/reload: write out every list that still has unsaved clicks
+        for view in list(self.views.values()):
+            if view.save_task and not view.save_task.done():
+                view.save_task.cancel()
+            view.update_db()
+
+    # --- ACTIVE LIST INDEX ---
+
+    def load_active_tasks(self):
+        """Builds the (guild_id, user_id) and message_id indexes of tasks_active once."""
+        self.active_by_user = {}
+        self.active_by_message = {}
+        for doc in self.bot.db.get_collection("tasks_active"):
+            # Keep the first list per user, like the old scan did
+            self.active_by_user.setdefault((doc.get('guild_id'), doc['user_id']), doc)
+            if doc.get('message_id'):
+                self.active_by_message[doc['message_id']] = doc
+
+    def get_active_task(self, guild_id, user_id):
+        return self.active_by_user.get((guild_id, user_id))
+
+    def get_active_task_by_message(self, message_id):
+        return self.active_by_message.get(message_id)
+
+    def add_active_task(self, doc):
+        """Indexes and appends a new active list."""
+        self.active_by_user[(doc.get('guild_id'), doc['user_id'])] = doc
+        self.active_by_message[doc['message_id']] = doc
+        current_active = self.bot.db.get_collection("tasks_active")
+        current_active.append(doc)
+        self.bot.db.save_collection("tasks_active", current_active)
+
+    def update_active_task(self, message_id, data):
+        """Merges data into the list posted as message_id (data may move it to a new message)."""
+        doc = self.active_by_message.pop(message_id, None)
+        if doc:
+            doc.update(data)
+            self.active_by_message[doc['message_id']] = doc
+        return self.bot.db.update_doc("tasks_active", "message_id", message_id, data)
+
+    def delete_active_task(self, message_id):
+        doc = self.active_by_message.pop(message_id, None)
+        if doc:
+            key = (doc.get('guild_id'), doc['user_id'])
+            if self.active_by_user.get(key) is doc:
+                del self.active_by_user[key]
+        self.bot.db.delete_doc("tasks_active", "message_id", message_id)
+
+    def get_task_view(self, message_id):
+        """Returns the live TaskView for a task message, rebuilding it from the index on first use."""
+        view = self.views.get(message_id)
+        if view: return view
+
+        doc = self.get_active_task_by_message(message_id)
+        if not doc: return None
 
-    async def restore_views(self):
-        # We need to wait until the bot is ready to add views
-        await self.bot.wait_until_ready()
-        
-        # Load all active tasks from main DB
-        active_tasks = self.bot.db.get_collection("tasks_active")
-        
-        count = 0
-        for doc in active_tasks:
-            try:
-                view = TaskView(
-                    cog=self,
-                    user_id=doc['user_id'], 
-                    total=doc['total'], 
-                    state=doc['state'], 
-                    message_id=doc['message_id']
-                )
-                self.bot.add_view(view)
-                count += 1
-            except Exception as e:
-                print(f"Failed to restore task view: {e}")
-        print(f"Restored {count} active task trackers in Tasks Cog.")
+        try:
+            view = TaskView(
+                cog=self,
+                user_id=doc['user_id'],
+                total=doc['total'],
+                state=doc['state'],
+                message_id=doc['message_id']
+            )
+        except Exception as e:
+            print(f"Failed to rebuild task view: {e}")
+            return None
+
+        self.views[message_id] = view
+        return view
+
+    def retire_view(self, message_id):
+        """Stops tracking a task message that is being replaced. Returns its live view, if any.
+
+        The caller takes over persistence, so the view's pending save is dropped.
+        """
+        view = self.views.pop(message_id, None)
+        if view: view.cancel_save()
+        return view
 
     def get_task_channel_id(self, guild_id):
         configs = self.bot.db.get_collection("tasks_config")
@@ -273,10 +449,11 @@ class Tasks(commands.Cog, name="tasks"):
 
         if action == "set":
             # Find existing tasks for this user in this server
-            active_tasks = self.bot.db.get_collection("tasks_active")
-            existing_doc = next((doc for doc in active_tasks if doc['user_id'] == interaction.user.id and doc.get('guild_id') == interaction.guild_id), None)
+            existing_doc = self.get_active_task(interaction.guild_id, interaction.user.id)
 
             if existing_doc:
+                self.retire_view(existing_doc['message_id'])
+
                 # Cleanup old message
                 try:
                     chan = self.bot.get_channel(existing_doc.get('channel_id'))
@@ -286,47 +463,45 @@ class Tasks(commands.Cog, name="tasks"):
                 except: pass
                 
                 # Remove from DB
-                self.bot.db.delete_doc("tasks_active", "message_id", existing_doc['message_id'])
+                self.delete_active_task(existing_doc['message_id'])
 
-            # Prepare new state
-            state = [0] * number
-            
-            # Create View immediately
+            # Create View immediately (fresh list: nothing completed yet)
             view = TaskView(
                 cog=self,
                 user_id=interaction.user.id,
-                total=number,
-                state=state
+                total=number
             )
             
-            content = f"<@{interaction.user.id}>'s tasks: 0/{number}\n{view.get_emoji_bar()}"
+            content = view.get_content()
             # Send Publicly
             await interaction.response.send_message(content, view=view)
             
             msg = await interaction.original_response()
             view.message_id = msg.id
+            self.views[msg.id] = view
             
             # Create new entry
             new_doc = {
                  "user_id": interaction.user.id,
                  "guild_id": interaction.guild.id, 
                  "total": number,
-                 "state": state,
+                 "state": view.pack_state(),
                  "message_id": msg.id, 
                  "channel_id": interaction.channel_id
             }
             # Append to DB
-            current_active = self.bot.db.get_collection("tasks_active")
-            current_active.append(new_doc)
-            self.bot.db.save_collection("tasks_active", current_active)
+            self.add_active_task(new_doc)
 
         elif action == "change":
-            active_tasks = self.bot.db.get_collection("tasks_active")
-            existing_doc = next((doc for doc in active_tasks if doc['user_id'] == interaction.user.id and doc.get('guild_id') == interaction.guild_id), None)
+            existing_doc = self.get_active_task(interaction.guild_id, interaction.user.id)
 
             if not existing_doc:
                 return await interaction.response.send_message("You don't have an active task list to change! Use `/tasks set` first.", ephemeral=True)
             
+            # Clicks on the old message may not be saved yet: the live view has the latest state
+            old_view = self.retire_view(existing_doc['message_id'])
+            state = old_view.pack_state() if old_view else existing_doc['state']
+
             # Cleanup old message view
             try:
                 chan = self.bot.get_channel(existing_doc.get('channel_id'))
@@ -335,16 +510,7 @@ class Tasks(commands.Cog, name="tasks"):
                     await msg.edit(view=None)
             except: pass
             
-            old_total = existing_doc['total']
-            state = existing_doc['state']
-            
-            # Resize state list
-            if number > old_total:
-                state.extend([0] * (number - old_total))
-            elif number < old_total:
-                state = state[:number]
-            
-            # Create View immediately
+            # Create View immediately. Growing just adds Todo; shrinking drops completed tasks past the new end
             view = TaskView(
                 cog=self,
                 user_id=interaction.user.id,
@@ -352,15 +518,16 @@ class Tasks(commands.Cog, name="tasks"):
                 state=state
             )
             
-            content = f"<@{interaction.user.id}>'s tasks: {state.count(1) + state.count(2) + state.count(3)}/{number}\n{view.get_emoji_bar()}"
+            content = view.get_content()
             # Send Publicly
             await interaction.response.send_message(content, view=view)
             
             msg = await interaction.original_response()
             view.message_id = msg.id
+            self.views[msg.id] = view
             
-            self.bot.db.update_doc("tasks_active", "message_id", existing_doc['message_id'], 
-                                   {"total": number, "state": state, "message_id": msg.id, "channel_id": interaction.channel_id})
+            self.update_active_task(existing_doc['message_id'],
+                                    {"total": number, "state": view.pack_state(), "message_id": msg.id, "channel_id": interaction.channel_id})
 
     @app_commands.command(name="progress", description="Shows your progress bar and buttons.", extras={'public': True})
     async def progress(self, interaction: discord.Interaction):
@@ -370,12 +537,15 @@ class Tasks(commands.Cog, name="tasks"):
         if channel_limit and interaction.channel_id != channel_limit:
             return await interaction.response.send_message(f"Please use <#{channel_limit}> for task commands!", ephemeral=True)
 
-        active_tasks = self.bot.db.get_collection("tasks_active")
-        doc = next((d for d in active_tasks if d['user_id'] == interaction.user.id and d.get('guild_id') == interaction.guild_id), None)
+        doc = self.get_active_task(interaction.guild_id, interaction.user.id)
         
         if not doc:
             return await interaction.response.send_message("You haven't set up any tasks yet! Use `/tasks set [number]` first.", ephemeral=True)
 
+        # Clicks on the old message may not be saved yet: the live view has the latest state
+        old_view = self.retire_view(doc.get('message_id'))
+        state = old_view.pack_state() if old_view else doc['state']
+
         # If there was an old message for this same task list, remove its buttons
         if doc.get('message_id'):
             try:
@@ -391,19 +561,20 @@ class Tasks(commands.Cog, name="tasks"):
             cog=self,
             user_id=interaction.user.id,
             total=doc['total'],
-            state=doc['state']
+            state=state
         )
 
-        content = f"<@{interaction.user.id}>'s tasks: {doc['state'].count(1) + doc['state'].count(2) + doc['state'].count(3)}/{doc['total']}\n{view.get_emoji_bar()}"
+        content = view.get_content()
         
         await interaction.response.send_message(content, view=view)
         
         # Update DB with new message ID
         msg = await interaction.original_response()
         view.message_id = msg.id
+        self.views[msg.id] = view
         
-        self.bot.db.update_doc("tasks_active", "message_id", doc['message_id'], # Use old message_id to find doc
-                               {"message_id": msg.id, "channel_id": interaction.channel_id}) # Update to new
+        self.update_active_task(doc['message_id'], # Use old message_id to find doc
+                                {"state": view.pack_state(), "message_id": msg.id, "channel_id": interaction.channel_id}) # Update to new
 
     @app_commands.command(name="taskchannel", description="Admin: Set the task commands channel.")
     @app_commands.describe(channel="The channel for task commands")